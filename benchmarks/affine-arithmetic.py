@@ -0,0 +1,81 @@
+"""
+The barometer networks with interval and with affine contents.
+
+Reports the width of the building height and the fall time after each
+measurement is added, and the number of firings it took to get there.
+In these networks every quantity is computed from independent measurements
+and merging intersects, so both content types reach the same widths.
+The round trip t -> h -> t outside a network shows the dependency problem
+that affine forms avoid.
+"""
+
+from propnet import Affine, Cell, Datum, Interval, Network, Support, product_, quadratic
+
+
+def barometer(kind):
+    net = Network()
+    g = net.add_cell('g', Cell(Datum(kind(9.789, 9.832))))
+    half = net.add_cell('half', Cell(Datum(kind(0.5, 0.5))))
+    t2 = net.add_cell('t^2', Cell())
+    gt2 = net.add_cell('gt^2', Cell())
+    t = net.add_cell('fall_time', Cell())
+    h = net.add_cell('building_height', Cell())
+    quadratic(t, t2, net=net)
+    product_(g, t2, gt2, net=net)
+    product_(half, gt2, h, net=net)
+
+    ratio = net.add_cell('ratio', Cell())
+    hba = net.add_cell('barometer_height', Cell())
+    sba = net.add_cell('barometer_shadow', Cell())
+    s = net.add_cell('building_shadow', Cell())
+    product_(sba, ratio, hba, net=net)
+    product_(s, ratio, h, net=net)
+    net.run()
+    return net
+
+
+MEASUREMENTS = (
+    ('building_shadow', (54.9, 55.1), 'shadows'),
+    ('barometer_height', (0.3, 0.32), 'shadows'),
+    ('barometer_shadow', (0.36, 0.37), 'shadows'),
+    ('fall_time', (2.9, 3.3), 'lousy fall time'),
+    ('fall_time', (2.9, 3.1), 'better fall time'),
+)
+
+
+def width(datum):
+    if datum is None:
+        return '-'
+    interval = datum.value.interval() if isinstance(datum.value, Affine) else datum.value
+    return f'{interval.hi - interval.lo:.6f}'
+
+
+def bench(label, kind):
+    net = barometer(kind)
+    print(label)
+    for name, (lo, hi), premise in MEASUREMENTS:
+        before = net.stats.firings
+        net[name].add_content(Datum(kind(lo, hi), Support(premise)), net)
+        net.run()
+        print(f'  {name:>16} {premise:>16}: height width {width(net["building_height"].content()):>8}, '
+              f'fall time width {width(net["fall_time"].content()):>8}, '
+              f'{net.stats.firings - before:3} firings')
+    print(f'  building_height = {net["building_height"].content()}')
+
+
+def round_trip(label, kind):
+    g, half, t = kind(9.789, 9.832), kind(0.5, 0.5), kind(2.9, 3.1)
+    h = half * g * t ** 2
+    back = (h / half / g).sqrt()
+    print(f'{label:>8} round trip: fall time width {width(Datum(t))} -> {width(Datum(back))}')
+
+
+def main():
+    bench('Interval', Interval)
+    bench('Affine', Affine.from_interval)
+    round_trip('Interval', Interval)
+    round_trip('Affine', Affine.from_interval)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Read latency from a query thread while another thread keeps propagating.
+
+Reads go through the lock-free snapshots of a ConcurrentNetwork.
+Latencies are measured once with an idle network and once while a writer
+thread continuously narrows the input of a long adder chain.
+"""
+
+import statistics
+import threading
+import time
+
+from propnet import Cell, ConcurrentNetwork, Datum, Interval, adder
+
+N_CELLS = 200
+N_READS = 100_000
+
+
+def chain(n):
+    net = ConcurrentNetwork(publish_every=10)
+    one = net.add_cell('one', Cell(Datum(Interval(1, 1))))
+    prev = net.add_cell('x0', Cell())
+    for i in range(1, n):
+        cell = net.add_cell(f'x{i}', Cell())
+        adder(prev, one, cell, net=net)
+        prev = cell
+    return net
+
+
+def writer(net, stop):
+    width = 1e6
+    while not stop.is_set():
+        width *= 0.99
+        net.add_content('x0', Datum(Interval(0, width)))
+        net.run()
+
+
+def measure(net, name):
+    latencies = []
+    for _ in range(N_READS):
+        start = time.perf_counter_ns()
+        net.snapshot()[name]
+        latencies.append(time.perf_counter_ns() - start)
+    latencies.sort()
+    return (statistics.median(latencies),
+            latencies[int(0.99 * len(latencies))],
+            latencies[-1])
+
+
+def report(label, latencies, epochs):
+    p50, p99, worst = latencies
+    print(f'{label:>12}: p50 {p50 / 1e3:6.2f} us  p99 {p99 / 1e3:6.2f} us  '
+          f'max {worst / 1e3:9.1f} us  (epochs published: {epochs})')
+
+
+def main():
+    name = f'x{N_CELLS - 1}'
+
+    net = chain(N_CELLS)
+    net.run()
+    start_epoch = net.snapshot().epoch
+    report('idle', measure(net, name), net.snapshot().epoch - start_epoch)
+
+    stop = threading.Event()
+    thread = threading.Thread(target=writer, args=(net, stop))
+    thread.start()
+    time.sleep(0.1)
+    start_epoch = net.snapshot().epoch
+    latencies = measure(net, name)
+    epochs = net.snapshot().epoch - start_epoch
+    stop.set()
+    thread.join()
+    report('propagating', latencies, epochs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Throughput of many independent barometer networks.
+
+Compares building and running one Network per query with a NetworkHost that
+recycles networks, and with sharding the queries over worker processes.
+"""
+
+import os
+import random
+import time
+
+from propnet import (Cell, Datum, Interval, Network, NetworkHost, product_, quadratic,
+                     solve_sharded)
+
+N_JOBS = 2000
+
+
+def fall_duration():
+    net = Network()
+    g = net.add_cell('g', Cell(Datum(Interval(9.789, 9.832))))
+    half = net.add_cell('half', Cell(Datum(Interval(0.5, 0.5))))
+    t2 = net.add_cell('t^2', Cell())
+    gt2 = net.add_cell('gt^2', Cell())
+    t = net.add_cell('fall_time', Cell())
+    h = net.add_cell('building_height', Cell())
+    quadratic(t, t2, net=net)
+    product_(g, t2, gt2, net=net)
+    product_(half, gt2, h, net=net)
+    return net
+
+
+def make_jobs():
+    rng = random.Random(1)
+    jobs = []
+    for _ in range(N_JOBS):
+        t = rng.uniform(2.5, 3.5)
+        jobs.append(({'fall_time': Datum(Interval(t, t + 0.1))}, ['building_height']))
+    return jobs
+
+
+def one_by_one(jobs):
+    results = []
+    for inputs, outputs in jobs:
+        net = fall_duration()
+        for name, content in inputs.items():
+            net[name].add_content(content, net)
+        net.run()
+        results.append({name: net[name].content() for name in outputs})
+    return results
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f'{label:>24}: {N_JOBS / seconds:9.0f} jobs/s')
+
+
+def main():
+    jobs = make_jobs()
+    timed('one network per job', lambda: one_by_one(jobs))
+    host = NetworkHost()
+    timed('host', lambda: host.solve_many(fall_duration, jobs))
+    for processes in sorted({1, 2, os.cpu_count() or 1}):
+        timed(f'sharded, {processes} processes',
+              lambda: solve_sharded(fall_duration, jobs, processes=processes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Throughput of propnet.Interval compared to the original interval class.
+
+The original class only handles positive intervals and does no outward
+rounding, so it is timed on positive operands only. The current class is
+timed on both positive (fast path) and sign-straddling (general) operands.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import timeit
+
+from propnet import Interval
+
+NUMBER = 200_000
+
+
+@dataclass(frozen=True)
+class OriginalInterval:
+    lo: float
+    hi: float
+
+    def __add__(self, other):
+        return OriginalInterval(self.lo + other.lo, self.hi + other.hi)
+
+    def __mul__(self, other):
+        return OriginalInterval(self.lo * other.lo, self.hi * other.hi)
+
+    def __truediv__(self, other):
+        return OriginalInterval(self.lo / other.hi, self.hi / other.lo)
+
+    def __pow__(self, power):
+        return OriginalInterval(self.lo ** 2, self.hi ** 2)
+
+
+def bench(label, a, b):
+    for op, stmt in (('+', 'a + b'), ('*', 'a * b'), ('/', 'a / b'), ('**2', 'a ** 2')):
+        seconds = timeit.timeit(stmt, globals={'a': a, 'b': b}, number=NUMBER)
+        print(f'{label:>20} {op:>3}: {seconds / NUMBER * 1e9:7.1f} ns')
+
+
+def main():
+    bench('original, positive', OriginalInterval(2.9, 3.1), OriginalInterval(9.789, 9.832))
+    bench('current, positive', Interval(2.9, 3.1), Interval(9.789, 9.832))
+    bench('current, mixed sign', Interval(-2.9, 3.1), Interval(-9.832, -9.789))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Monte Carlo over the barometer shadow network: a Python loop of runs with
+point intervals as contents versus one run with Samples contents.
+(Number contents clash on rounding differences between the directions.)
+
+Also shows conditioning: the fall-time network adds its estimate of the
+building's height and the worlds that disagree are rejected.
+"""
+
+import time
+
+import numpy as np
+
+from propnet import Cell, Datum, Interval, Network, product_, quadratic
+from propnet.samples import Samples
+
+WORLDS = 20_000
+
+
+def shadows(net):
+    ratio = net.add_cell('ratio', Cell())
+    hba = net.add_cell('barometer_height', Cell())
+    sba = net.add_cell('barometer_shadow', Cell())
+    s = net.add_cell('building_shadow', Cell())
+    h = net.cells.get('building_height') or net.add_cell('building_height', Cell())
+    product_(sba, ratio, hba, net=net)
+    product_(s, ratio, h, net=net)
+    return net
+
+
+def fall_duration(net):
+    g = net.add_cell('g', Cell(Datum(Samples.uniform(9.789, 9.832, WORLDS))))
+    half = net.add_cell('half', Cell(Datum(0.5)))
+    t2 = net.add_cell('t^2', Cell())
+    gt2 = net.add_cell('gt^2', Cell())
+    t = net.add_cell('fall_time', Cell())
+    h = net.cells.get('building_height') or net.add_cell('building_height', Cell())
+    quadratic(t, t2, net=net)
+    product_(g, t2, gt2, net=net)
+    product_(half, gt2, h, net=net)
+    return net
+
+
+def main():
+    rng = np.random.default_rng(1)
+    inputs = {
+        'building_shadow': rng.normal(55.0, 0.05, WORLDS),
+        'barometer_height': rng.normal(0.31, 0.005, WORLDS),
+        'barometer_shadow': rng.normal(0.365, 0.0025, WORLDS),
+    }
+
+    loops = 500
+    start = time.perf_counter()
+    heights = []
+    for i in range(loops):
+        net = shadows(Network())
+        for name, values in inputs.items():
+            net[name].add_content(Datum(Interval(values[i], values[i])), net)
+        net.run()
+        height = net['building_height'].content().value
+        heights.append((height.lo + height.hi) / 2)
+    seconds = (time.perf_counter() - start) / loops * WORLDS
+    print(f'  loop of runs: {seconds * 1e3:8.1f} ms for {WORLDS} worlds (extrapolated from {loops}), '
+          f'height {np.mean(heights):.4g} ± {np.std(heights):.3g}')
+
+    start = time.perf_counter()
+    net = shadows(Network())
+    for name, values in inputs.items():
+        net[name].add_content(Datum(Samples(values)), net)
+    net.run()
+    seconds = time.perf_counter() - start
+    print(f'   one Samples run: {seconds * 1e3:8.1f} ms for {WORLDS} worlds, '
+          f'height {net["building_height"].content().value}')
+
+    fall_duration(net)
+    net['fall_time'].add_content(Datum(Samples.normal(3.0, 0.05, WORLDS, rng)), net)
+    net.run()
+    print(f'with fall time: height {net["building_height"].content().value}, '
+          f'fall time {net["fall_time"].content().value}')
+    net['building_height'].add_content(Datum(Interval(44.0, 45.0)), net)
+    net.run()
+    print(f'  height in [44, 45]: fall time {net["fall_time"].content().value}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Wide networks fired one propagator at a time versus in NumPy wavefronts.
+
+The network consists of many independent chains of the form
+x[i+1] = x[i] * scale + offset, with number and interval contents.
+"""
+
+import time
+
+from propnet import Cell, Datum, Interval, Network, Support, adder, multiplier
+from propnet.wavefront import WavefrontNetwork
+
+WIDTH = 256
+DEPTH = 8
+
+
+def build(cls, make_content):
+    net = cls()
+    scale = net.add_cell('scale', Cell(make_content(1.01)))
+    offset = net.add_cell('offset', Cell(make_content(0.5)))
+    inputs = []
+    for i in range(WIDTH):
+        prev = net.add_cell(f'x{i},0', Cell())
+        inputs.append(prev)
+        for j in range(1, DEPTH):
+            scaled = net.add_cell(f's{i},{j}', Cell())
+            multiplier(prev, scale, scaled, net=net)
+            cell = net.add_cell(f'x{i},{j}', Cell())
+            adder(scaled, offset, cell, net=net)
+            prev = cell
+    net.run()
+    return net, inputs
+
+
+def bench(label, cls, make_content):
+    net, inputs = build(cls, make_content)
+    start = time.perf_counter()
+    for i, cell in enumerate(inputs):
+        cell.add_content(make_content(float(i)), net)
+    net.run()
+    seconds = time.perf_counter() - start
+    print(f'{label:>38}: {seconds * 1e3:8.1f} ms  ({net.stats.firings} firings)')
+    return net[f'x{WIDTH - 1},{DEPTH - 1}'].content()
+
+
+def main():
+    kinds = (
+        ('numbers', lambda x: x),
+        ('intervals', lambda x: Interval(x, x + 0.1)),
+        ('supported intervals', lambda x: Datum(Interval(x, x + 0.1), Support('input'))),
+    )
+    for kind, make_content in kinds:
+        a = bench(f'{kind}, Network', Network, make_content)
+        b = bench(f'{kind}, WavefrontNetwork', WavefrontNetwork, make_content)
+        print(f'{"":>38}  {a}\n{"":>38}  {b}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,149 @@
 from __future__ import annotations
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
+import enum
 import math
-from typing import Any, Callable
+import operator
+import time
+import weakref
+from typing import Any, Callable, Iterable, Protocol
 
 from .graph import mermaid
 
 
+class RunStatus(enum.Enum):
+    QUIESCENT = enum.auto()
+    BUDGET_EXHAUSTED = enum.auto()
+    DEADLINE_EXCEEDED = enum.auto()
+    CANCELLED = enum.auto()
+    OSCILLATING = enum.auto()
+    # Quiescent only because oscillating propagators were damped.
+    DAMPED = enum.auto()
+
+    @property
+    def quiescent(self) -> bool:
+        return self is RunStatus.QUIESCENT
+
+    @property
+    def resumable(self) -> bool:
+        """The run stopped at a limit, calling ``run`` again continues it."""
+        return self in (RunStatus.BUDGET_EXHAUSTED, RunStatus.DEADLINE_EXCEEDED, RunStatus.CANCELLED)
+
+
+@dataclass
+class Stats:
+    firings: int = 0
+    # Firings that returned early because the inputs were unchanged.
+    skipped: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        return self.skipped / self.firings if self.firings else 0.0
+
+
+class Contradiction(ValueError, RuntimeError):
+    """Raised by a merge when two contents cannot both be true."""
+
+
+class Content(Protocol):
+    """The content-lattice protocol of cell contents.
+
+    ``merge`` returns the content that holds if both ``self`` and ``other``
+    hold, or raises Contradiction. ``implies`` tells whether merging ``other``
+    adds no information. None is nothing, the content of an empty cell.
+    Values without a merge method, e.g., numbers, form a flat lattice in
+    which different values contradict each other.
+    """
+    def merge(self, other) -> Any: ...
+    def implies(self, other) -> bool: ...
+
+
+# Premises not believed by the network that is running, see propnet.tms.
+_disbelieved: ContextVar[set[str] | frozenset[str]] = ContextVar('disbelieved', default=frozenset())
+
+
+class CancelToken(Protocol):
+    # E.g., threading.Event
+    def is_set(self) -> bool: ...
+
+
 @dataclass
 class Network:
     cells: dict[str, Cell] = field(default_factory=dict)
     alerted_propagators: list[Callable] = field(default_factory=list)
     propagators_ever_alerted: list[Callable] = field(default_factory=list)
+    convergence: Convergence | None = None
+    stats: Stats = field(default_factory=Stats)
+    # The propagator that is currently running, if any.
+    firing: Callable | None = field(default=None, repr=False)
+    provenance: Provenance | None = field(default=None, repr=False)
+    # id(cell) -> watches of the cell
+    watches: dict[int, list[Watch]] = field(default_factory=dict, repr=False)
+    # id(watch) -> (watch, content before the first change), delivered by notify
+    pending_changes: dict[int, tuple[Watch, Any]] = field(default_factory=dict, repr=False)
+    oscillation: OscillationDetector | None = field(default=None, repr=False)
+    # Premises kicked out of this network's worldview, see propnet.tms.
+    disbelieved: set[str] = field(default_factory=set, repr=False)
+    # Numbers the runs, a run that is resumed after a limit keeps its number.
+    run_number: int = field(default=0, repr=False)
+    resuming: bool = field(default=False, repr=False)
 
     def add_cell(self, name: str, cell: Cell):
         self.cells[name] = cell
         return cell
 
+    def remove_cell(self, name: str):
+        """Remove the named cell and every propagator that reads or writes it."""
+        self.remove_cells(name)
+
+    def remove_cells(self, *names: str):
+        """Like remove_cell, but looks for the attached propagators only once."""
+        cells = [self.cells.pop(name) for name in names]
+        removed = {id(cell) for cell in cells}
+        attached = [prop for prop in self.propagators_ever_alerted
+                    if any(id(c) in removed for c in getattr(prop, 'cells', ()))]
+        self.remove_propagators(*attached, *(prop for cell in cells for prop in cell.neighbors))
+        for cell in cells:
+            for watch in self.watches.pop(id(cell), ()):
+                self.pending_changes.pop(id(watch), None)
+            if self.provenance is not None:
+                self.provenance.forget(cell)
+            if self.oscillation is not None:
+                self.oscillation.forget(cell)
+
+    def remove_constraint(self, constraint: Callable):
+        self.remove_propagators(constraint)
+
+    def remove_propagators(self, *propagators: Callable):
+        removed = {id(prop) for prop in propagators}
+        if not removed:
+            return
+        cells = {id(c): c for prop in propagators for c in getattr(prop, 'cells', ())}
+        if any(not hasattr(prop, 'cells') for prop in propagators):
+            # Only the cells know which propagators read them.
+            cells.update((id(c), c) for c in self.cells.values())
+        for cell in cells.values():
+            if any(id(prop) in removed for prop in cell.neighbors):
+                cell.neighbors = [prop for prop in cell.neighbors if id(prop) not in removed]
+        self.alerted_propagators = [p for p in self.alerted_propagators if id(p) not in removed]
+        self.propagators_ever_alerted = [p for p in self.propagators_ever_alerted
+                                         if id(p) not in removed]
+
+    def collect(self, *outputs: str) -> tuple[int, int]:
+        """Remove the cells and propagators that cannot affect the named cells.
+
+        Returns the numbers of removed cells and propagators, see ``propnet.collect``.
+        """
+        from .collect import collect
+        return collect(self, outputs)
+
+    def track_history(self, capacity: int, *names: str):
+        """Record the last ``capacity`` changes of the named cells or of all cells."""
+        for name in names or self.cells:
+            self.cells[name].track_history(capacity)
+
     def alert_propagator(self, *propagators):
         for prop in propagators:
             if prop not in self.alerted_propagators:
@@ -23,29 +151,217 @@ class Network:
             if prop not in self.propagators_ever_alerted:
                 self.propagators_ever_alerted.append(prop)
 
-    def run(self):
-        while self.alerted_propagators:
-            prop = self.alerted_propagators.pop(0)
-            prop()
+    def forget_inputs(self, propagators: Iterable[Callable] | None = None):
+        """Make the propagators, all by default, recompute even if their inputs look unchanged."""
+        for prop in self.propagators_ever_alerted if propagators is None else propagators:
+            if hasattr(prop, 'last'):
+                prop.last = None
+
+    def content_changed(self, cell: Cell, previous: Any = None):
+        if cell.history is not None:
+            cell.history.record(cell.value, self.firing)
+        if self.provenance is not None:
+            self.provenance.record(cell, self.firing)
+        if self.oscillation is not None:
+            self.oscillation.record(self, cell, previous)
+        for watch in self.watches.get(id(cell), ()):
+            if not watch.coalesce:
+                watch.callback(Change(watch.name, previous, cell.value))
+            elif id(watch) not in self.pending_changes:
+                self.pending_changes[id(watch)] = (watch, previous)
+        self.alert_propagator(*cell.neighbors)
+
+    def watch(self, name: str, callback: Callable[[Change], Any], coalesce: bool = False) -> Watch:
+        """Call ``callback`` with a Change whenever the named cell's content changes.
+
+        With ``coalesce``, all changes of a run are reported once, at its end,
+        as are changes made between runs. To receive changes on a queue, pass
+        its ``put_nowait``.
+        """
+        watch = Watch(self, name, self.cells[name], callback, coalesce)
+        self.watches.setdefault(id(watch.cell), []).append(watch)
+        return watch
+
+    def notify(self):
+        """Report the pending coalesced changes."""
+        pending, self.pending_changes = self.pending_changes, {}
+        for watch, previous in pending.values():
+            watch.callback(Change(watch.name, previous, watch.cell.value))
+
+    def track_provenance(self, capacity: int = 16):
+        """Record who wrote each cell from now on, see ``propnet.provenance``."""
+        self.provenance = Provenance(capacity)
+
+    def detect_oscillation(self, window: int = 8, max_changes: int | None = 1000,
+                           damp: bool = False):
+        """Stop runs that do not converge, or ``damp`` them, see ``propnet.oscillation``."""
+        self.oscillation = OscillationDetector(window, max_changes, damp)
+
+    def explain(self, name: str) -> Derivation:
+        from .provenance import explain
+        return explain(self, name)
+
+    def fork(self) -> Fork:
+        """Copy-on-write branch of this network, see ``propnet.fork``."""
+        return Fork(self, alerted_propagators=list(self.alerted_propagators))
+
+    def run(self, max_firings: int | None = None, deadline: float | None = None,
+            cancel_token: CancelToken | None = None) -> RunStatus:
+        """Fire alerted propagators until the network is quiescent or a limit is hit.
+
+        ``deadline`` is an absolute time as returned by ``time.monotonic()``.
+        Limits are only checked between firings, so when the run stops early,
+        the network is consistent and calling ``run`` again resumes it.
+        """
+        firings = 0
+        status = RunStatus.QUIESCENT
+        oscillation = self.oscillation
+        self.start_run()
+        with self.worldview():
+            while self.alerted_propagators:
+                if max_firings is not None and firings >= max_firings:
+                    status = RunStatus.BUDGET_EXHAUSTED
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    status = RunStatus.DEADLINE_EXCEEDED
+                    break
+                if cancel_token is not None and cancel_token.is_set():
+                    status = RunStatus.CANCELLED
+                    break
+                self.fire_next()
+                firings += 1
+                if oscillation is not None and oscillation.tripped:
+                    status = RunStatus.OSCILLATING
+                    break
+        status = self.finish_run(status)
+        self.notify()
+        return status
+
+    def start_run(self):
+        if not self.resuming:
+            self.run_number += 1
+        if self.oscillation is not None:
+            self.oscillation.start_run()
+
+    def finish_run(self, status: RunStatus) -> RunStatus:
+        """The status to return from a run that ended with ``status``."""
+        self.resuming = status.resumable
+        if self.oscillation is not None:
+            status = self.oscillation.finish(status)
+        return status
+
+    @contextmanager
+    def worldview(self):
+        """Contents believe what this network believes while in the context."""
+        token = _disbelieved.set(self.disbelieved)
+        try:
+            yield
+        finally:
+            _disbelieved.reset(token)
+
+    def fire_next(self):
+        prop = self.alerted_propagators.pop(0)
+        if self.oscillation is not None and id(prop) in self.oscillation.damped:
+            return
+        self.fire(prop)
+
+    def fire(self, prop: Callable):
+        self.stats.firings += 1
+        self.firing = prop
+        if self.provenance is not None:
+            self.provenance.begin(prop)
+        prop()
+        self.firing = None
 
     def __getitem__(self, key):
         return self.cells[key]
 
 
-@dataclass(init=False)
+# Flattened premise sets, so that equal sets are stored only once.
+_interned_supports: weakref.WeakValueDictionary[frozenset[str], Support] = weakref.WeakValueDictionary()
+
+
 class Support:
-    sup: set[str]
+    """Set of premises.
+
+    Merging builds a union node in O(1) instead of copying the premises.
+    The union is only flattened into a set when ``sup`` is accessed,
+    after which the node drops its children and shares the set with all
+    equal supports.
+    """
+    __slots__ = ('_sup', '_parts', '_last_merge', '__weakref__')
 
-    def __init__(self, sup: set[str] | str | None = None) -> None:
+    def __init__(self, sup: set[str] | frozenset[str] | str | None = None) -> None:
         if isinstance(sup, str):
             sup = {sup}
-        self.sup = sup or set()
+        self._parts: tuple[Support, Support] | None = None
+        self._last_merge: tuple[Support, Support] | None = None
+        self._set_sup(frozenset(sup or ()))
+
+    @classmethod
+    def _union(cls, a: Support, b: Support) -> Support:
+        node = cls.__new__(cls)
+        node._sup = None
+        node._parts = (a, b)
+        node._last_merge = None
+        return node
+
+    def _set_sup(self, sup: frozenset[str]):
+        self._sup = sup
+        canonical = _interned_supports.setdefault(sup, self)
+        if canonical is not self:
+            self._sup = canonical._sup
+
+    @property
+    def sup(self) -> frozenset[str]:
+        if self._sup is None:
+            # Iterative because derivation chains can be deeper than the recursion limit.
+            premises = set()
+            stack = [self]
+            seen = set()
+            while stack:
+                node = stack.pop()
+                # Another thread may flatten the node meanwhile. It sets _sup
+                # before it clears _parts, so read them in the opposite order.
+                parts = node._parts
+                if node._sup is not None:
+                    premises |= node._sup
+                elif id(node) not in seen:
+                    seen.add(id(node))
+                    stack.extend(parts)
+            self._set_sup(frozenset(premises))
+            self._parts = None
+        return self._sup
 
     def more_informative_than(self, other: Support) -> bool:
+        if self is other:
+            return False
         return self.sup != other.sup and self.sup.issubset(other.sup)
 
     def merge(self, other: Support) -> Support:
-        return Support(self.sup | other.sup)
+        if other is self or (other._sup is not None and not other._sup):
+            return self
+        if self._sup is not None and not self._sup:
+            return other
+        if self._last_merge is not None and self._last_merge[0] is other:
+            return self._last_merge[1]
+        merged = Support._union(self, other)
+        self._last_merge = (other, merged)
+        return merged
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Support):
+            return NotImplemented
+        return self is other or self.sup == other.sup
+
+    def __hash__(self) -> int:
+        return hash(self.sup)
+
+    def __reduce__(self):
+        return Support, (set(self.sup),)
+
+    def __repr__(self) -> str:
+        return f"Support(sup={set(self.sup)!r})"
 
 
 # called v&s in thesis
@@ -55,6 +371,8 @@ class Datum:
     support: Support = field(default_factory=Support)
 
     def merge(self, other: Datum) -> Datum:
+        if not isinstance(other, Datum):
+            other = Datum(other)
         v1 = self.value
         v2 = other.value
         vm = merge(v1, v2)
@@ -83,6 +401,8 @@ class Datum:
         return Datum(value=self.value / other.value, support=self.support.merge(other.support))
 
     def __pow__(self, power: Datum) -> Datum:
+        if not isinstance(power, Datum):
+            power = Datum(power)
         return Datum(value=self.value ** power.value, support=self.support.merge(power.support))
 
     def sqrt(self) -> Datum:
@@ -94,7 +414,37 @@ class Datum:
         return str(self.value)
 
 
-@dataclass(frozen=True)
+_nextafter = math.nextafter
+_inf = math.inf
+
+
+def _down(x):
+    return _nextafter(x, -_inf)
+
+
+def _up(x):
+    return _nextafter(x, _inf)
+
+
+def _pow(x, n):
+    # Float powers raise OverflowError instead of returning inf.
+    try:
+        return x ** n
+    except OverflowError:
+        return _inf if x > 0 or n % 2 == 0 else -_inf
+
+
+def _mul(a, b):
+    # 0 * inf is 0 in interval arithmetic, not nan.
+    if a == 0 or b == 0:
+        return 0.0
+    return a * b
+
+
+# All operations round outward by one ulp, so the result encloses the exact
+# result of the operation on the bounds. The common cases call nextafter
+# directly, the others round with _down and _up.
+@dataclass(frozen=True, slots=True)
 class Interval:
     lo: float
     hi: float
@@ -105,36 +455,102 @@ class Interval:
             return x
         return Interval(lo=x, hi=x)
 
+    @staticmethod
+    def entire() -> Interval:
+        return Interval(-math.inf, math.inf)
+
+    @staticmethod
+    def empty() -> Interval:
+        return Interval(math.inf, -math.inf)
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
     def __add__(self, other):
         other = Interval.intervalise(other)
-        return Interval(self.lo + other.lo, self.hi + other.hi)
+        return Interval(_nextafter(self.lo + other.lo, -_inf), _nextafter(self.hi + other.hi, _inf))
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        other = Interval.intervalise(other)
+        return Interval(_nextafter(self.lo - other.hi, -_inf), _nextafter(self.hi - other.lo, _inf))
+
+    def __rsub__(self, other):
+        return Interval.intervalise(other) - self
 
     def __mul__(self, other):
         other = Interval.intervalise(other)
-        return Interval(self.lo * other.lo, self.hi * other.hi)
+        a, b, c, d = self.lo, self.hi, other.lo, other.hi
+        # Strictly positive, so no bound is 0 * inf.
+        if a > 0 and c > 0:
+            return Interval(_nextafter(a * c, -_inf), _nextafter(b * d, _inf))
+        products = (_mul(a, c), _mul(a, d), _mul(b, c), _mul(b, d))
+        return Interval(_down(min(products)), _up(max(products)))
 
     def __rmul__(self, other):
-        other = Interval.intervalise(other)
-        return Interval(other.lo * self.lo, other.hi * self.hi)
+        return self * other
 
     def __truediv__(self, other):
         other = Interval.intervalise(other)
-        return Interval(self.lo / other.hi, self.hi / other.lo)
+        a, b, c, d = self.lo, self.hi, other.lo, other.hi
+        if c > 0:
+            if a >= 0:
+                return Interval(_nextafter(a / d, -_inf), _nextafter(b / c, _inf))
+            return self * Interval(_down(1 / d), _up(1 / c))
+        if d < 0:
+            return self * Interval(_down(1 / d), _up(1 / c))
+        # The divisor contains zero, the result is the hull of the quotient set.
+        if a <= 0 <= b:
+            return Interval.entire()
+        if c == 0 and d == 0:
+            return Interval.empty()
+        if c < 0 < d:
+            return Interval.entire()
+        if c == 0:  # [c, d] = [0, d]
+            if a > 0:
+                return Interval(_down(a / d), math.inf)
+            return Interval(-math.inf, _up(b / d))
+        # [c, d] = [c, 0]
+        if a > 0:
+            return Interval(-math.inf, _up(a / c))
+        return Interval(_down(b / c), math.inf)
+
+    def __rtruediv__(self, other):
+        return Interval.intervalise(other) / self
 
     def __pow__(self, power):
+        lo, hi = self.lo, self.hi
+        if power == 2 and lo > 0:
+            return Interval(_nextafter(lo * lo, -_inf), _nextafter(hi * hi, _inf))
         if isinstance(power, Interval):
             if power.lo != power.hi:
                 raise NotImplementedError("Only intervals with equal lo and hi are supported")
             power = power.lo
-        if power != 2:
-            raise NotImplementedError("Can only raise to power of 2")
-        return Interval(self.lo ** 2, self.hi ** 2)
+        if power != int(power):
+            raise NotImplementedError("Can only raise to integer powers")
+        power = int(power)
+        if power == 0:
+            return Interval(1, 1)
+        if power < 0:
+            return Interval(1, 1) / self ** -power
+        if lo >= 0:
+            return Interval(max(0.0, _down(_pow(lo, power))), _up(_pow(hi, power)))
+        if power % 2 == 1:
+            return Interval(_down(_pow(lo, power)), _up(_pow(hi, power)))
+        if hi <= 0:
+            return Interval(max(0.0, _down(_pow(hi, power))), _up(_pow(lo, power)))
+        return Interval(0.0, _up(max(_pow(lo, power), _pow(hi, power))))
 
     def sqrt(self):
-        return Interval(math.sqrt(self.lo), math.sqrt(self.hi))
+        if self.hi < 0:
+            return Interval.empty()
+        lo = math.sqrt(self.lo) if self.lo > 0 else 0.0
+        return Interval(max(0.0, _down(lo)), _up(math.sqrt(self.hi)))
 
     def intersect(self, other: Interval) -> Interval:
-        other= Interval.intervalise(other)
+        other = Interval.intervalise(other)
         return Interval(max(self.lo, other.lo),
                         min(self.hi, other.hi))
 
@@ -146,7 +562,7 @@ class Interval:
         if new == self:
             return self
         if new.is_empty():
-            raise ValueError("empty interval")
+            raise Contradiction("empty interval")
         return new
 
     def implies(self, other: Interval) -> bool:
@@ -156,24 +572,137 @@ class Interval:
         return f"[{self.lo}, {self.hi}]"
 
 
+def _interval_of(x) -> Interval | None:
+    if isinstance(x, Datum):
+        x = x.value
+    if isinstance(x, Affine):
+        return x.interval()
+    return x if isinstance(x, Interval) else None
+
+
+@dataclass(frozen=True)
+class Convergence:
+    """When to consider a narrowing of interval content too small to propagate.
+
+    A narrowing is negligible if it shrinks the width by at most
+    ``max(abs_tol, rel_tol * old_width)`` or if propagators have already
+    refined the cell ``max_refinements`` times in the current run.
+    Writes from outside a run are not capped.
+    Negligible narrowings are treated as no change.
+    """
+    abs_tol: float = 0.0
+    rel_tol: float = 0.0
+    max_refinements: int | None = None
+
+    def negligible(self, old, new, refinements: int | None) -> bool:
+        # refinements is None for writes from outside a run.
+        old = _interval_of(old)
+        new = _interval_of(new)
+        if old is None or new is None or old == new:
+            # Not a narrowing, e.g., only the support changed.
+            return False
+        if (self.max_refinements is not None and refinements is not None
+                and refinements >= self.max_refinements):
+            return True
+        old_width = old.hi - old.lo
+        if math.isinf(old_width):
+            return False
+        return old_width - (new.hi - new.lo) <= max(self.abs_tol, self.rel_tol * old_width)
+
+
+@dataclass(frozen=True)
+class Revision:
+    version: int
+    content: Any
+    # The propagator that wrote the content, None if written from outside a run.
+    writer: Callable | None
+
+    @property
+    def support(self) -> Support | None:
+        return self.content.support if isinstance(self.content, Datum) else None
+
+
+class History:
+    """Ring buffer of the most recent revisions of a cell's content."""
+
+    def __init__(self, capacity: int) -> None:
+        self.version = 0
+        self.revisions: deque[Revision] = deque(maxlen=capacity)
+
+    def record(self, content, writer: Callable | None):
+        self.version += 1
+        self.revisions.append(Revision(self.version, content, writer))
+
+    def __iter__(self):
+        return iter(self.revisions)
+
+    def __len__(self) -> int:
+        return len(self.revisions)
+
+
+@dataclass(frozen=True)
+class Change:
+    name: str
+    # None if the cell was empty
+    previous: Any
+    content: Any
+
+
+@dataclass(eq=False)
+class Watch:
+    net: Network = field(repr=False)
+    name: str
+    cell: Cell = field(repr=False)
+    callback: Callable[[Change], Any]
+    coalesce: bool = False
+
+    def cancel(self):
+        watches = self.net.watches.get(id(self.cell), [])
+        if self in watches:
+            watches.remove(self)
+        self.net.pending_changes.pop(id(self), None)
+
+
 @dataclass
 class Cell:
     value: Datum | None = None
     neighbors: list[Callable] = field(default_factory=list)
+    # Overrides the network's convergence policy for this cell.
+    convergence: Convergence | None = None
+    # Refinements by propagators in the run numbered refined_in.
+    refinements: int = field(default=0, repr=False)
+    refined_in: int = field(default=0, repr=False)
+    history: History | None = field(default=None, repr=False)
 
     def content(self) -> Datum:
         return self.value
 
+    def track_history(self, capacity: int):
+        self.history = History(capacity)
+        if self.value is not None:
+            self.history.record(self.value, None)
+
     def add_content(self, increment: Datum | None, net: Network):
         if increment is None:
             return
-        if self.value is None:
+        previous = self.value
+        if previous is None:
             self.value = increment
         else:
-            if (merged := self.value.merge(increment)) == self.value:
+            if (merged := merge(self.value, increment)) == self.value:
+                return
+            refinements = None
+            if net.firing is not None:
+                if self.refined_in != net.run_number:
+                    self.refined_in, self.refinements = net.run_number, 0
+                refinements = self.refinements
+            policy = self.convergence or net.convergence
+            if policy is not None and policy.negligible(self.value, merged, refinements):
                 return
             self.value = merged
-        net.alert_propagator(*self.neighbors)
+            if refinements is not None:
+                self.refinements += 1
+        net.content_changed(self, previous)
 
     def add_neighbor(self, new_neighbor: Callable, net: Network):
         if new_neighbor not in self.neighbors:
@@ -185,12 +714,20 @@ class Cell:
 
 
 def merge(a, b):
-    if isinstance(a, Interval):
+    """Merge two contents, see Content."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    # Numbers and intervals are merged into richer contents, e.g., Affine.
+    if isinstance(a, (int, float, Interval)) and not isinstance(b, (int, float, Interval)):
+        a, b = b, a
+    if hasattr(a, 'merge'):
         return a.merge(b)
     if isinstance(b, Interval):
-        return Interval.intervalise(a).merge(b)
+        return b.merge(a)
     if a != b:
-        raise RuntimeError(f"Clashing numbers: {a} and {b}")
+        raise Contradiction(f"Clashing numbers: {a} and {b}")
     return a
 
 
@@ -205,9 +742,10 @@ def sqrt(x):
 
 
 def propagator(neighbors: tuple[Cell], func: Callable, net: Network):
+    # Alert first, so that networks can refuse new propagators before cells change.
+    net.alert_propagator(func)
     for cell in neighbors:
         cell.add_neighbor(func, net)
-    net.alert_propagator(func)
 
 
 def call_if_full_information(func, cells: tuple[Cell]):
@@ -218,22 +756,55 @@ def call_if_full_information(func, cells: tuple[Cell]):
     return func(*values)
 
 
-def make_propagator(func: Callable):
+def make_propagator(func: Callable, label: str | None = None):
     def maker(*cells: Cell, net: Network):
         output = cells[-1]
         inp = cells[:-1]
-        impl = lambda: output.add_content(call_if_full_information(func, inp), net)
+
+        # Contents are immutable and replaced on change, so comparing identities
+        # tells whether the inputs changed since the last firing.
+        def impl():
+            values = tuple(cell.value for cell in inp)
+            if impl.last is not None and all(map(operator.is_, values, impl.last)):
+                net.stats.skipped += 1
+                return
+            impl.last = values
+            if any(v is None for v in values):
+                return
+            output.add_content(func(*values), net)
+
+        # Allows passes over the network to recognise what a propagator computes.
+        impl.func = func
+        impl.cells = cells
+        impl.label = label or func.__name__
+        # Inputs seen by the last firing.
+        impl.last = None
         propagator(inp, impl, net)
 
+    maker.func = func
     return maker
 
 
-adder = make_propagator(lambda a, b: a + b)
-subtractor = make_propagator(lambda a, b: a - b)
-multiplier = make_propagator(lambda a, b: a * b)
-divider = make_propagator(lambda a, b: a / b)
-squarer = make_propagator(lambda a: a ** Datum(2))
-sqrter = make_propagator(lambda a: sqrt(a))
+def _reads(prop) -> tuple[Cell, ...]:
+    """The cells a propagator made by make_propagator or a Constraint reads."""
+    if isinstance(prop, Constraint):
+        return prop.cells
+    return tuple(getattr(prop, 'cells', ())[:-1])
+
+
+def _writes(prop) -> tuple[Cell, ...]:
+    """The cells a propagator made by make_propagator or a Constraint writes."""
+    if isinstance(prop, Constraint):
+        return prop.cells
+    return tuple(getattr(prop, 'cells', ())[-1:])
+
+
+adder = make_propagator(lambda a, b: a + b, 'adder')
+subtractor = make_propagator(lambda a, b: a - b, 'subtractor')
+multiplier = make_propagator(lambda a, b: a * b, 'multiplier')
+divider = make_propagator(lambda a, b: a / b, 'divider')
+squarer = make_propagator(lambda a: a ** 2, 'squarer')
+sqrter = make_propagator(lambda a: sqrt(a), 'sqrter')
 
 
 def sum_(x, y, total, net):
@@ -251,3 +822,19 @@ def product_(x, y, total, net):
 def quadratic(x, x2, net):
     squarer(x, x2, net=net)
     sqrter(x2, x, net=net)
+
+
+from .concurrent import ConcurrentNetwork, Snapshot
+from .constraints import (Constraint, Linear, Product, Quadratic, constraint, fused_product,
+                          fused_quadratic, fused_sum, linear, nary_product, nary_sum)
+from .expressions import BinOp, Const, Equation, Expr, Pow, Sqrt, Var, equation, var
+from .linsolve import solve_linear
+from .host import NetworkHost, solve_sharded
+from .template import NetworkTemplate, TemplateNetwork
+from .distributed import run_distributed
+from .fork import Fork
+from .provenance import Derivation, Provenance
+from .oscillation import Oscillation, OscillationDetector
+from .lazy import LazyNetwork
+from .affine import Affine
+from .tms import TMS, bring_in, kick_out
@@ -0,0 +1,264 @@
+"""
+Affine arithmetic as cell content.
+
+An Affine is a form x0 + x1*e1 + ... + xn*en over noise symbols e_i in [-1, 1].
+Quantities computed from the same inputs share noise symbols, so their
+correlations are kept where intervals lose them: x - x is 0 and x * (1 / x)
+stays close to 1.
+The error of linearising a nonlinear operation and of rounding goes into a
+fresh noise symbol per operation.
+
+Each Affine also carries interval bounds, computed with Interval arithmetic
+alongside the form and intersected on merges, so it is never wider than the
+corresponding Interval. Two forms of the same quantity a and b are merged into
+the affine combination l*a + (1-l)*b of smallest radius, which is a form of
+that quantity as well.
+
+    t = Affine.from_interval(2.9, 3.1)
+    h = Affine(0.5) * g * t ** 2
+
+Numbers and Intervals can be combined with Affines, but cells holding Affines
+should be given Affines as they are not understood by Interval's methods.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import itertools
+import math
+
+from . import Contradiction, Interval, _down, _up
+
+# Relative error bound of the few float operations that compute a coefficient.
+_EPS = 2.0 ** -50
+
+_symbols = itertools.count()
+
+
+def _coerce(x) -> Affine | None:
+    if isinstance(x, Affine):
+        return x
+    if isinstance(x, Interval):
+        return Affine.from_interval(x.lo, x.hi)
+    if isinstance(x, (int, float)):
+        return Affine(float(x))
+    return None
+
+
+def _make(center: float, terms: dict[int, float], err: float, scale: float,
+          bounds: Interval | None = None) -> Affine:
+    # ``scale`` bounds the magnitude of the values the coefficients were computed from.
+    err += _EPS * scale
+    terms = {k: v for k, v in terms.items() if v}
+    if len(terms) >= Affine.max_terms:
+        # Condense the smallest terms, they become uncorrelated error.
+        kept = sorted(terms, key=lambda k: abs(terms[k]), reverse=True)[:Affine.max_terms - 1]
+        err += sum(abs(v) for k, v in terms.items() if k not in kept)
+        terms = {k: terms[k] for k in kept}
+    if err:
+        terms[next(_symbols)] = err
+    return Affine(center, terms)._bounded(bounds)
+
+
+@dataclass(frozen=True, slots=True)
+class Affine:
+    center: float
+    # noise symbol -> partial deviation
+    terms: dict[int, float] = field(default_factory=dict, hash=False)
+    # Tighter bounds than the form's range, if known.
+    bounds: Interval | None = None
+
+    # Forms with more terms are condensed.
+    max_terms = 32
+
+    @staticmethod
+    def from_interval(lo: float, hi: float) -> Affine:
+        if math.isinf(lo) or math.isinf(hi):
+            raise ValueError("Affine forms must be bounded")
+        center = (lo + hi) / 2
+        return _make(center, {}, _up(max(hi - center, center - lo)), 0.0)
+
+    @property
+    def radius(self) -> float:
+        return math.fsum(map(abs, self.terms.values()))
+
+    @property
+    def magnitude(self) -> float:
+        return abs(self.center) + self.radius
+
+    def form_range(self) -> Interval:
+        radius = _up(self.radius)
+        return Interval(_down(self.center - radius), _up(self.center + radius))
+
+    def interval(self) -> Interval:
+        return self.form_range() if self.bounds is None else self.bounds
+
+    def _bounded(self, bounds: Interval | None) -> Affine:
+        if bounds is None:
+            return self
+        current = self.interval()
+        if bounds.lo <= current.lo and current.hi <= bounds.hi:
+            return self
+        if (bounds := current.intersect(bounds)).is_empty():
+            raise Contradiction("empty interval")
+        return Affine(self.center, self.terms, bounds)
+
+    def __neg__(self):
+        bounds = None if self.bounds is None else -self.bounds
+        return Affine(-self.center, {k: -v for k, v in self.terms.items()}, bounds)
+
+    def __add__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        terms = dict(self.terms)
+        for k, v in other.terms.items():
+            terms[k] = terms.get(k, 0.0) + v
+        return _make(self.center + other.center, terms, 0.0, self.magnitude + other.magnitude,
+                     self.interval() + other.interval())
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        return other + -self
+
+    def __mul__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        x0, y0 = self.center, other.center
+        terms = {k: y0 * v for k, v in self.terms.items()}
+        for k, v in other.terms.items():
+            terms[k] = terms.get(k, 0.0) + x0 * v
+        return _make(x0 * y0, terms, self.radius * other.radius, self.magnitude * other.magnitude,
+                     self.interval() * other.interval())
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        return self * other.reciprocal()
+
+    def __rtruediv__(self, other):
+        if (other := _coerce(other)) is None:
+            return NotImplemented
+        return other * self.reciprocal()
+
+    def _linear(self, alpha: float, zeta: float, delta: float, bounds: Interval) -> Affine:
+        # alpha * self + zeta +- delta
+        terms = {k: alpha * v for k, v in self.terms.items()}
+        scale = abs(alpha) * self.magnitude + abs(zeta) + delta
+        return _make(alpha * self.center + zeta, terms, delta, scale, bounds)
+
+    def reciprocal(self) -> Affine:
+        i = self.interval()
+        if i.lo <= 0 <= i.hi:
+            raise ZeroDivisionError("affine form contains zero")
+        if i.hi < 0:
+            return -(-self).reciprocal()
+        # Min-range approximation, 1/x - alpha*x is decreasing on [a, b].
+        a, b = i.lo, i.hi
+        alpha = -1 / (b * b)
+        high, low = 1 / a - alpha * a, 2 / b
+        return self._linear(alpha, (high + low) / 2, (high - low) / 2, 1 / i)
+
+    def square(self) -> Affine:
+        x0, r = self.center, self.radius
+        terms = {k: 2 * x0 * v for k, v in self.terms.items()}
+        # (sum x_i e_i)**2 is in [0, r**2]
+        return _make(x0 * x0 + r * r / 2, terms, r * r / 2, self.magnitude ** 2,
+                     self.interval() ** 2)
+
+    def __pow__(self, power):
+        if isinstance(power, Affine):
+            if power.terms:
+                raise NotImplementedError("Only constant affine powers are supported")
+            power = power.center
+        elif isinstance(power, Interval):
+            if power.lo != power.hi:
+                raise NotImplementedError("Only intervals with equal lo and hi are supported")
+            power = power.lo
+        if power != int(power):
+            raise NotImplementedError("Can only raise to integer powers")
+        power = int(power)
+        if power == 0:
+            return Affine(1.0)
+        if power < 0:
+            return (self ** -power).reciprocal()
+        # Squaring keeps more correlation than multiplying a form by itself.
+        result, base = None, self
+        while True:
+            if power & 1:
+                result = base if result is None else result * base
+            power >>= 1
+            if not power:
+                return result
+            base = base.square()
+
+    def sqrt(self) -> Affine:
+        i = self.interval()
+        if i.hi < 0:
+            raise Contradiction("square root of a negative affine form")
+        if i.hi == 0:
+            return Affine(0.0)
+        # Chebyshev approximation: sqrt lies between the secant and the
+        # parallel tangent on [a, b].
+        ra, rb = math.sqrt(max(0.0, i.lo)), math.sqrt(i.hi)
+        alpha = 1 / (ra + rb)
+        tangent, secant = (ra + rb) / 4, ra * rb / (ra + rb)
+        return self._linear(alpha, (tangent + secant) / 2, (tangent - secant) / 2, i.sqrt())
+
+    def _combine(self, other: Affine) -> Affine:
+        # The radius of l*a + (1-l)*b is sum(|d_i| * |l - l_i|) with
+        # d_i = a_i - b_i and l_i = -b_i / d_i, minimal at a weighted median of l_i.
+        breaks = []
+        for k in self.terms.keys() | other.terms.keys():
+            a, b = self.terms.get(k, 0.0), other.terms.get(k, 0.0)
+            if d := a - b:
+                breaks.append((-b / d, abs(d)))
+        breaks.sort()
+        half, weight, best = sum(w for _, w in breaks) / 2, 0.0, 1.0
+        for l, w in breaks:
+            weight += w
+            if weight >= half:
+                best = l
+                break
+        if best == 1:
+            return self
+        if best == 0:
+            return other if other.radius < self.radius else self
+        terms = {k: best * v for k, v in self.terms.items()}
+        for k, v in other.terms.items():
+            terms[k] = terms.get(k, 0.0) + (1 - best) * v
+        combined = _make(best * self.center + (1 - best) * other.center, terms, 0.0,
+                         abs(best) * self.magnitude + abs(1 - best) * other.magnitude)
+        if combined.radius >= min(self.radius, other.radius):
+            return self if self.radius <= other.radius else other
+        return combined
+
+    def merge(self, other) -> Affine:
+        if isinstance(other, Interval) and (math.isinf(other.lo) or math.isinf(other.hi)):
+            return self._bounded(other)
+        if (form := _coerce(other)) is None:
+            raise TypeError(f"Cannot merge {other!r} into an affine form")
+        bounds = self.interval().intersect(form.interval())
+        if bounds.is_empty():
+            raise Contradiction("empty interval")
+        combined = self._combine(form)
+        # A narrower form is only worth propagating if it narrows the bounds.
+        if combined is self or combined.form_range().hi - combined.form_range().lo >= bounds.hi - bounds.lo:
+            return self._bounded(bounds)
+        return Affine(combined.center, combined.terms)._bounded(bounds)
+
+    def implies(self, other) -> bool:
+        return self == self.merge(other)
+
+    def __str__(self) -> str:
+        return str(self.interval())
@@ -0,0 +1,53 @@
+"""
+Collecting the parts of a network that no longer matter.
+
+A propagator is live if it writes a live cell, and a cell is live if it is
+one of the given outputs or is read by a live propagator. ``Network.collect``
+removes everything else, so that networks which get sub-models added and
+dropped over time do not keep them alive.
+
+Propagators whose cells are not known, i.e., that were neither made by
+make_propagator nor are Constraints, are always live, as are the cells that
+have them as neighbors. Provenance records and histories of live cells may
+refer to removed propagators until they are overwritten.
+
+    net.remove_cell('barometer_shadow')  # drops similar triangles' propagators
+    net.collect('building_height')       # and whatever only they needed
+"""
+
+from __future__ import annotations
+from typing import Callable
+
+from . import _reads, _writes
+
+
+def collect(net, outputs) -> tuple[int, int]:
+    propagators: dict[int, Callable] = {id(p): p for p in net.propagators_ever_alerted}
+    propagators.update((id(p), p) for p in net.alerted_propagators)
+    writers: dict[int, list[Callable]] = {}
+    for prop in propagators.values():
+        if hasattr(prop, 'cells'):
+            for cell in _writes(prop):
+                writers.setdefault(id(cell), []).append(prop)
+
+    live_props = {key for key, prop in propagators.items() if not hasattr(prop, 'cells')}
+    roots = [net[name] for name in outputs]
+    roots += [cell for cell in net.cells.values()
+              if any(id(prop) in live_props for prop in cell.neighbors)]
+    live_cells = {id(cell) for cell in roots}
+    stack = list(roots)
+    while stack:
+        for prop in writers.get(id(stack.pop()), ()):
+            if id(prop) in live_props:
+                continue
+            live_props.add(id(prop))
+            for cell in _reads(prop):
+                if id(cell) not in live_cells:
+                    live_cells.add(id(cell))
+                    stack.append(cell)
+
+    dead = [prop for key, prop in propagators.items() if key not in live_props]
+    net.remove_propagators(*dead)
+    dead_cells = [name for name, cell in net.cells.items() if id(cell) not in live_cells]
+    net.remove_cells(*dead_cells)
+    return len(dead_cells), len(dead)
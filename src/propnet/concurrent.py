@@ -0,0 +1,107 @@
+"""
+Network that can be read from other threads while it runs.
+
+Readers never take a lock. They get an immutable, versioned snapshot of all
+named cells which the writer replaces (copy-on-write) as propagation proceeds.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from . import Cell, Network, RunStatus
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    epoch: int
+    contents: Mapping[str, Any]
+
+    def __getitem__(self, key):
+        return self.contents[key]
+
+
+@dataclass
+class ConcurrentNetwork(Network):
+    # Number of propagator firings between published snapshots. Publishing
+    # copies the contents, so by default it happens every max(64, len(cells))
+    # firings, which costs O(1) per firing on average.
+    # A snapshot is always published when a run ends.
+    publish_every: int | None = None
+    _snapshot: Snapshot = field(default_factory=lambda: Snapshot(0, MappingProxyType({})), repr=False)
+    _names: dict[int, str] = field(default_factory=dict, repr=False)
+    _dirty: set[str] = field(default_factory=set, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    # Firings since the last published snapshot.
+    _firings: int = field(default=0, repr=False)
+
+    def add_cell(self, name: str, cell: Cell):
+        with self._lock:
+            super().add_cell(name, cell)
+            self._names[id(cell)] = name
+            self._dirty.add(name)
+            self.publish()
+        return cell
+
+    def remove_cells(self, *names: str):
+        with self._lock:
+            cells = [self.cells[name] for name in names]
+            super().remove_cells(*names)
+            contents = dict(self._snapshot.contents)
+            for name, cell in zip(names, cells):
+                self._names.pop(id(cell), None)
+                self._dirty.discard(name)
+                contents.pop(name, None)
+            self._snapshot = Snapshot(self._snapshot.epoch + 1, MappingProxyType(contents))
+
+    def remove_propagators(self, *propagators: Callable):
+        with self._lock:
+            super().remove_propagators(*propagators)
+
+    def collect(self, *outputs: str) -> tuple[int, int]:
+        with self._lock:
+            return super().collect(*outputs)
+
+    def add_content(self, name: str, increment: Any):
+        """Thread-safe version of ``net[name].add_content(increment, net)``."""
+        with self._lock:
+            self.cells[name].add_content(increment, self)
+            self.publish()
+
+    def content_changed(self, cell: Cell, previous: Any = None):
+        if (name := self._names.get(id(cell))) is not None:
+            self._dirty.add(name)
+        super().content_changed(cell, previous)
+
+    def publish(self) -> Snapshot:
+        with self._lock:
+            self._firings = 0
+            if not self._dirty:
+                return self._snapshot
+            contents = dict(self._snapshot.contents)
+            for name in self._dirty:
+                contents[name] = self.cells[name].value
+            self._dirty.clear()
+            self._snapshot = Snapshot(self._snapshot.epoch + 1, MappingProxyType(contents))
+            return self._snapshot
+
+    def snapshot(self) -> Snapshot:
+        # A single attribute read is atomic, so readers do not need the lock.
+        return self._snapshot
+
+    def fire_next(self):
+        with self._lock:
+            # Another thread may have drained the queue since run checked it.
+            if not self.alerted_propagators:
+                return
+            super().fire_next()
+            self._firings += 1
+            if self._firings >= (self.publish_every or max(64, len(self.cells))):
+                self.publish()
+
+    def run(self, *args, **kwargs) -> RunStatus:
+        status = super().run(*args, **kwargs)
+        self.publish()
+        return status
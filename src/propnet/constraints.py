@@ -0,0 +1,176 @@
+"""
+Multi-directional constraints implemented as a single propagator.
+
+``sum_``, ``product_`` and ``quadratic`` build one propagator per direction,
+each of which reads its inputs independently.
+The constraints here compute all directions that can be computed in one firing.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import operator
+from typing import Any, Sequence
+
+from . import Cell, Datum, Network, propagator, sqrt
+
+
+def _lift(constant, like):
+    # Constants must match the kind of content they are combined with.
+    if isinstance(like, Datum) and not isinstance(constant, Datum):
+        return Datum(constant)
+    return constant
+
+
+# eq=False because propagators are compared by identity when alerting.
+@dataclass(eq=False)
+class Constraint:
+    cells: tuple[Cell, ...]
+    net: Network
+    last: list | None = field(default=None, init=False, repr=False)
+
+    def __call__(self):
+        values = [cell.content() for cell in self.cells]
+        # Revising the same contents again cannot add information.
+        if self.last is not None and all(map(operator.is_, values, self.last)):
+            self.net.stats.skipped += 1
+            return
+        self.last = values
+        for cell, value in zip(self.cells, self.revise(values)):
+            cell.add_content(value, self.net)
+
+    def revise(self, values: list) -> Sequence[Any]:
+        """Return new content for every cell, or None where nothing can be deduced."""
+        raise NotImplementedError
+
+
+def _plus(a, b):
+    # None is the empty sum.
+    if a is None:
+        return b
+    return a if b is None else a + b
+
+
+def _times(a, b):
+    # None is the empty product.
+    if a is None:
+        return b
+    return a if b is None else a * b
+
+
+def _divide(a, b):
+    return a if b is None else a / b
+
+
+def _prefixes(op, xs):
+    # [op(xs[:0]), op(xs[:1]), ..., op(xs)]
+    res = [None]
+    for x in xs:
+        res.append(op(res[-1], x))
+    return res
+
+
+def _suffixes(op, xs):
+    # [op(xs[0:]), op(xs[1:]), ..., op(xs[n:])]
+    return _prefixes(op, xs[::-1])[::-1]
+
+
+@dataclass(eq=False)
+class Linear(Constraint):
+    """``sum(coefficients[i] * cells[i]) == constant``"""
+    coefficients: tuple[float, ...]
+    constant: float
+
+    def revise(self, values):
+        missing = [i for i, v in enumerate(values) if v is None]
+        if len(missing) > 1:
+            return [None] * len(values)
+        # Plain numbers if nothing is known, e.g., for linear([2], [x], 4).
+        like = next((v for v in values if v is not None), None)
+        terms = [v if a == 1 or v is None else _lift(a, like) * v
+                 for a, v in zip(self.coefficients, values)]
+        if missing:
+            i = missing[0]
+            new = [None] * len(values)
+            rest = None
+            for term in terms[:i] + terms[i + 1:]:
+                rest = _plus(rest, term)
+            new[i] = self._solve(i, rest, like)
+            return new
+
+        prefix = _prefixes(_plus, terms)
+        suffix = _suffixes(_plus, terms)
+        return [self._solve(i, _plus(prefix[i], suffix[i + 1]), like)
+                for i in range(len(values))]
+
+    def _solve(self, i, rest, like):
+        a = self.coefficients[i]
+        if a == 0:
+            return None
+        res = _lift(self.constant, like)
+        if rest is not None:
+            res = res - rest
+        return res if a == 1 else res / _lift(a, like)
+
+
+@dataclass(eq=False)
+class Product(Constraint):
+    """``cells[0] * ... * cells[-2] == cells[-1]``"""
+
+    def revise(self, values):
+        *factors, total = values
+        if not factors:
+            return [1]  # the empty product
+        n = len(factors)
+        missing = [i for i, v in enumerate(values) if v is None]
+        if len(missing) > 1:
+            return [None] * len(values)
+        if missing == [n]:
+            return [None] * n + [_prefixes(_times, factors)[-1]]
+        if missing:
+            i = missing[0]
+            new = [None] * len(values)
+            new[i] = _divide(total, _prefixes(_times, factors[:i] + factors[i + 1:])[-1])
+            return new
+
+        prefix = _prefixes(_times, factors)
+        suffix = _suffixes(_times, factors)
+        return [_divide(total, _times(prefix[i], suffix[i + 1])) for i in range(n)] + [prefix[-1]]
+
+
+@dataclass(eq=False)
+class Quadratic(Constraint):
+    """``cells[0] ** 2 == cells[1]`` using the positive root."""
+
+    def revise(self, values):
+        x, x2 = values
+        return [None if x2 is None else sqrt(x2),
+                None if x is None else x ** _lift(2, x)]
+
+
+def constraint(c: Constraint) -> Constraint:
+    propagator(c.cells, c, c.net)
+    return c
+
+
+def linear(coefficients, cells, constant, net):
+    return constraint(Linear(tuple(cells), net, tuple(coefficients), constant))
+
+
+def nary_sum(terms, total, net):
+    return linear([1] * len(terms) + [-1], [*terms, total], 0, net)
+
+
+def nary_product(factors, total, net):
+    return constraint(Product((*factors, total), net))
+
+
+def fused_sum(x, y, total, net):
+    return nary_sum([x, y], total, net)
+
+
+def fused_product(x, y, total, net):
+    return nary_product([x, y], total, net)
+
+
+def fused_quadratic(x, x2, net):
+    return constraint(Quadratic((x, x2), net))
@@ -0,0 +1,170 @@
+"""
+Running the partitions of a network in separate processes.
+
+Each partition is built in its own worker process by a module-level builder
+function. Cells with the same name in several partitions are boundary cells.
+When a worker's propagation changes a boundary cell, the new content is sent
+to the other partitions that have that cell and do not have it yet, batched
+into one message per peer and round. So content is not sent back to the
+partition it came from.
+
+Global quiescence is detected with the Dijkstra-Scholten algorithm:
+Every update message is acknowledged. A worker that receives an update while
+idle is engaged by the sender and acknowledges that message only once it is
+idle again and all of its own messages have been acknowledged. The
+coordinator starts the computation and knows it has terminated once all of its
+messages have been acknowledged.
+
+The transport is a multiprocessing queue per process, which stands in for
+sockets between hosts.
+"""
+
+from __future__ import annotations
+import multiprocessing
+from typing import Any, Callable, Mapping, Sequence
+
+from . import Network
+
+Builder = Callable[[], Network]
+
+COORDINATOR = -1
+
+
+def _worker(index: int, builder: Builder, inboxes: list, coordinator):
+    try:
+        net = builder()
+    except Exception as err:
+        coordinator.put(('error', index, repr(err)))
+        return
+    inbox = inboxes[index]
+    coordinator.put(('names', index, list(net.cells)))
+    # Peers may send updates before the start message arrives, so what they
+    # already know is what the builder put into the cells.
+    initial = {name: cell.content() for name, cell in net.cells.items()}
+
+    peers: dict[str, list[int]] = {}
+    # name -> {peer: the content it was sent or sent us last}
+    known: dict[str, dict[int, Any]] = {}
+    parent: int | None = None
+    deficit = 0
+    failed = False
+
+    def send(dest: int, msg):
+        (coordinator if dest == COORDINATOR else inboxes[dest]).put(msg)
+
+    while True:
+        messages = [inbox.get()]
+        while not inbox.empty():
+            messages.append(inbox.get())
+
+        for msg in messages:
+            kind = msg[0]
+            if kind == 'stop':
+                return
+            if kind == 'query':
+                send(COORDINATOR, ('result', index,
+                                   {name: net[name].content() for name in msg[1] if name in net.cells}))
+            elif kind == 'ack':
+                deficit -= 1
+            elif kind in ('start', 'update'):
+                sender, contents = msg[1], msg[2]
+                if kind == 'start':
+                    peers = msg[3]
+                    for name, dests in peers.items():
+                        for dest in dests:
+                            known.setdefault(name, {}).setdefault(dest, initial[name])
+                if parent is None:
+                    parent = sender
+                else:
+                    send(sender, ('ack', index))
+                if not failed:
+                    try:
+                        for name, content in contents.items():
+                            net[name].add_content(content, net)
+                            known.setdefault(name, {})[sender] = content
+                    except Exception as err:
+                        failed = True
+                        send(COORDINATOR, ('error', index, repr(err)))
+
+        if not failed:
+            try:
+                net.run()
+            except Exception as err:
+                failed = True
+                send(COORDINATOR, ('error', index, repr(err)))
+
+        if not failed:
+            batches: dict[int, dict[str, Any]] = {}
+            for name, dests in peers.items():
+                content = net[name].content()
+                for dest in dests:
+                    if known[name][dest] is not content:
+                        known[name][dest] = content
+                        batches.setdefault(dest, {})[name] = content
+            for dest, contents in batches.items():
+                send(dest, ('update', index, contents))
+                deficit += 1
+
+        if parent is not None and deficit == 0:
+            send(parent, ('ack', index))
+            parent = None
+
+
+def run_distributed(partitions: Sequence[Builder], inputs: Mapping[str, Any],
+                    outputs: Sequence[str], timeout: float | None = None) -> dict[str, Any]:
+    """Run a partitioned network to global quiescence and return the requested outputs.
+
+    ``inputs`` are added to every partition that has a cell of that name.
+    Raises RuntimeError if a partition fails, e.g., because of a contradiction.
+    """
+    ctx = multiprocessing.get_context()
+    inboxes = [ctx.Queue() for _ in partitions]
+    coordinator = ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(i, builder, inboxes, coordinator), daemon=True)
+               for i, builder in enumerate(partitions)]
+    for worker in workers:
+        worker.start()
+
+    try:
+        names: dict[int, list[str]] = {}
+        while len(names) < len(partitions):
+            msg = coordinator.get(timeout=timeout)
+            if msg[0] == 'error':
+                raise RuntimeError(f"Partition {msg[1]} failed: {msg[2]}")
+            _, index, cell_names = msg
+            names[index] = cell_names
+
+        owners: dict[str, list[int]] = {}
+        for index, cell_names in names.items():
+            for name in cell_names:
+                owners.setdefault(name, []).append(index)
+
+        deficit = 0
+        for index, cell_names in names.items():
+            peers = {name: [i for i in owners[name] if i != index]
+                     for name in cell_names if len(owners[name]) > 1}
+            contents = {name: inputs[name] for name in cell_names if name in inputs}
+            inboxes[index].put(('start', COORDINATOR, contents, peers))
+            deficit += 1
+
+        while deficit > 0:
+            msg = coordinator.get(timeout=timeout)
+            if msg[0] == 'ack':
+                deficit -= 1
+            elif msg[0] == 'error':
+                raise RuntimeError(f"Partition {msg[1]} failed: {msg[2]}")
+
+        for inbox in inboxes:
+            inbox.put(('query', list(outputs)))
+        results: dict[str, Any] = {}
+        for _ in partitions:
+            msg = coordinator.get(timeout=timeout)
+            for name, content in msg[2].items():
+                if results.get(name) is None:
+                    results[name] = content
+        return results
+    finally:
+        for inbox in inboxes:
+            inbox.put(('stop',))
+        for worker in workers:
+            worker.join(timeout=timeout)
@@ -0,0 +1,252 @@
+"""
+Constraints given as arithmetic expressions over cells.
+
+Each equation becomes a single propagator that narrows the intervals of all
+cells in it using an HC4 revise:
+A forward pass evaluates every sub-expression over intervals, and a backward
+pass intersects each node with the inverse of its parent operation.
+The network's queue of alerted propagators acts as the AC-3 worklist;
+an equation is re-run whenever one of its cells is narrowed.
+
+    x, y, z = var(net['x']), var(net['y']), var(net['z'])
+    equation(x * y + 1, z ** 2, net=net)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import math
+
+from . import (Cell, Constraint, Contradiction, Datum, Interval, Network, Support, _down, _pow, _up,
+               constraint)
+
+
+def _lift(x) -> Expr:
+    if isinstance(x, Expr):
+        return x
+    if isinstance(x, Cell):
+        return Var(x)
+    return Const(Interval.intervalise(x))
+
+
+# eq=False to keep == free for identity and to make nodes hashable.
+@dataclass(frozen=True, eq=False)
+class Expr:
+    def __add__(self, other):
+        return BinOp('+', self, _lift(other))
+
+    def __radd__(self, other):
+        return BinOp('+', _lift(other), self)
+
+    def __sub__(self, other):
+        return BinOp('-', self, _lift(other))
+
+    def __rsub__(self, other):
+        return BinOp('-', _lift(other), self)
+
+    def __mul__(self, other):
+        return BinOp('*', self, _lift(other))
+
+    def __rmul__(self, other):
+        return BinOp('*', _lift(other), self)
+
+    def __truediv__(self, other):
+        return BinOp('/', self, _lift(other))
+
+    def __rtruediv__(self, other):
+        return BinOp('/', _lift(other), self)
+
+    def __neg__(self):
+        return BinOp('-', Const(Interval(0, 0)), self)
+
+    def __pow__(self, power: int):
+        if power != int(power):
+            raise NotImplementedError("Can only raise to integer powers")
+        return Pow(self, int(power))
+
+    def sqrt(self):
+        return Sqrt(self)
+
+
+@dataclass(frozen=True, eq=False)
+class Var(Expr):
+    cell: Cell
+
+
+@dataclass(frozen=True, eq=False)
+class Const(Expr):
+    value: Interval
+
+
+@dataclass(frozen=True, eq=False)
+class BinOp(Expr):
+    op: str
+    left: Expr
+    right: Expr
+
+
+@dataclass(frozen=True, eq=False)
+class Pow(Expr):
+    base: Expr
+    power: int
+
+
+@dataclass(frozen=True, eq=False)
+class Sqrt(Expr):
+    arg: Expr
+
+
+def var(cell: Cell) -> Var:
+    return Var(cell)
+
+
+def _root(x: float, n: int, direction: float) -> float:
+    # n-th root of x >= 0, rounded outward in the given direction.
+    if x == 0 or math.isinf(x):
+        return x
+    if (exponent := math.frexp(x)[1]) < -500:
+        # Scaling by a power of 2 ** n is exact and keeps powers of the root normal.
+        k = -exponent // n + 1
+        return math.ldexp(_root(math.ldexp(x, k * n), n, direction), -k)
+    # 1 / n is rounded, so x ** (1 / n) can be many ulps off for large or small x.
+    root = x ** (1 / n)
+    root += (x / _pow(root, n - 1) - root) / n
+    if direction < 0:
+        while root > 0 and _up(_pow(root, n)) > x:
+            root = _down(root)
+    else:
+        while _down(_pow(root, n)) < x:
+            root = _up(root)
+    return root
+
+
+def _inverse_pow(node: Interval, base: Interval, n: int) -> Interval:
+    if n < 0:
+        return _inverse_pow(Interval(1, 1) / node, base, -n)
+    if n % 2 == 1:
+        lo = _root(abs(node.lo), n, math.inf if node.lo < 0 else -math.inf)
+        hi = _root(abs(node.hi), n, -math.inf if node.hi < 0 else math.inf)
+        return Interval(-lo if node.lo < 0 else lo, -hi if node.hi < 0 else hi)
+    node = node.intersect(Interval(0, math.inf))
+    if node.is_empty():
+        return node
+    lo = _root(node.lo, n, -math.inf)
+    hi = _root(node.hi, n, math.inf)
+    if base.lo >= 0:
+        return Interval(lo, hi)
+    if base.hi <= 0:
+        return Interval(-hi, -lo)
+    return Interval(-hi, hi)
+
+
+def _cells(expr: Expr, out: dict[int, Cell]):
+    if isinstance(expr, Var):
+        out.setdefault(id(expr.cell), expr.cell)
+    elif isinstance(expr, BinOp):
+        _cells(expr.left, out)
+        _cells(expr.right, out)
+    elif isinstance(expr, Pow):
+        _cells(expr.base, out)
+    elif isinstance(expr, Sqrt):
+        _cells(expr.arg, out)
+
+
+@dataclass(eq=False)
+class Equation(Constraint):
+    """``lhs == rhs`` narrowed with HC4 revise."""
+    lhs: Expr
+    rhs: Expr
+    _index: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._index = {id(cell): i for i, cell in enumerate(self.cells)}
+
+    def revise(self, values):
+        domains = []
+        premises = set()
+        use_datum = False
+        for v in values:
+            if isinstance(v, Datum):
+                premises |= v.support.sup
+                use_datum = True
+                v = v.value
+            domains.append(Interval.entire() if v is None else Interval.intervalise(v))
+
+        forward: dict[int, Interval] = {}
+        self._forward(self.lhs, domains, forward)
+        self._forward(self.rhs, domains, forward)
+        root = forward[id(self.lhs)].intersect(forward[id(self.rhs)])
+        new = list(domains)
+        self._backward(self.lhs, root, forward, new)
+        self._backward(self.rhs, root, forward, new)
+
+        res = []
+        for old, narrowed in zip(domains, new):
+            if narrowed == old:
+                res.append(None)
+            elif use_datum:
+                res.append(Datum(narrowed, Support(set(premises))))
+            else:
+                res.append(narrowed)
+        return res
+
+    def _forward(self, expr, domains, forward) -> Interval:
+        if isinstance(expr, Var):
+            res = domains[self._index[id(expr.cell)]]
+        elif isinstance(expr, Const):
+            res = expr.value
+        elif isinstance(expr, BinOp):
+            left = self._forward(expr.left, domains, forward)
+            right = self._forward(expr.right, domains, forward)
+            if expr.op == '+':
+                res = left + right
+            elif expr.op == '-':
+                res = left - right
+            elif expr.op == '*':
+                res = left * right
+            else:
+                res = left / right
+        elif isinstance(expr, Pow):
+            res = self._forward(expr.base, domains, forward) ** expr.power
+        else:
+            res = self._forward(expr.arg, domains, forward).sqrt()
+        forward[id(expr)] = res
+        return res
+
+    def _backward(self, expr, value: Interval, forward, new):
+        value = value.intersect(forward[id(expr)])
+        if value.is_empty():
+            raise Contradiction("empty interval")
+        if isinstance(expr, Var):
+            i = self._index[id(expr.cell)]
+            new[i] = new[i].intersect(value)
+            if new[i].is_empty():
+                raise Contradiction("empty interval")
+        elif isinstance(expr, BinOp):
+            left = forward[id(expr.left)]
+            right = forward[id(expr.right)]
+            if expr.op == '+':
+                self._backward(expr.left, value - right, forward, new)
+                self._backward(expr.right, value - left, forward, new)
+            elif expr.op == '-':
+                self._backward(expr.left, value + right, forward, new)
+                self._backward(expr.right, left - value, forward, new)
+            elif expr.op == '*':
+                self._backward(expr.left, value / right, forward, new)
+                self._backward(expr.right, value / left, forward, new)
+            else:
+                self._backward(expr.left, value * right, forward, new)
+                self._backward(expr.right, left / value, forward, new)
+        elif isinstance(expr, Pow):
+            base = forward[id(expr.base)]
+            self._backward(expr.base, _inverse_pow(value, base, expr.power), forward, new)
+        elif isinstance(expr, Sqrt):
+            self._backward(expr.arg, value.intersect(Interval(0, math.inf)) ** 2, forward, new)
+
+
+def equation(lhs, rhs, net: Network) -> Equation:
+    lhs = _lift(lhs)
+    rhs = _lift(rhs)
+    cells: dict[int, Cell] = {}
+    _cells(lhs, cells)
+    _cells(rhs, cells)
+    return constraint(Equation(tuple(cells.values()), net, lhs, rhs))
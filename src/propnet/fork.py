@@ -0,0 +1,120 @@
+"""
+Copy-on-write branches of a network for what-if evaluation.
+
+A Fork shares cells and propagators with its base network and only stores the
+contents of the cells that were written in the fork. To run the fork, these
+contents are swapped into the shared cells, the base's propagators run against
+them and the results are swapped out again. So the base must not be used while
+one of its forks runs. Cell histories, watches, provenance, oscillation
+detection and the snapshots of a ConcurrentNetwork only see the base's own
+writes, and propagators keep the inputs they last saw in the base.
+
+    what_if = net.fork()
+    what_if.add_content('fall_time', Datum(Interval(3.0, 3.05), Support('stopwatch')))
+    what_if.run()
+    print(what_if.content('building_height'))
+    what_if.merge_back()  # or simply drop it
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from . import Cell, Network, RunStatus, Stats
+
+
+@dataclass
+class Fork:
+    base: Network
+    # id(cell) -> (cell, content)
+    overlay: dict[int, tuple[Cell, Any]] = field(default_factory=dict)
+    alerted_propagators: list = field(default_factory=list)
+    stats: Stats = field(default_factory=Stats)
+
+    def content(self, name: str):
+        cell = self.base[name]
+        if (entry := self.overlay.get(id(cell))) is not None:
+            return entry[1]
+        return cell.value
+
+    def add_content(self, name: str, increment: Any):
+        with self._active():
+            self.base[name].add_content(increment, self.base)
+
+    def run(self, *args, **kwargs) -> RunStatus:
+        with self._active():
+            return self.base.run(*args, **kwargs)
+
+    def fork(self) -> Fork:
+        return Fork(self.base, dict(self.overlay), list(self.alerted_propagators))
+
+    def merge_back(self):
+        """Add everything the fork learned to the base network, which must then be run."""
+        for cell, content in self.overlay.values():
+            cell.add_content(content, self.base)
+        self.discard()
+
+    def discard(self):
+        self.overlay.clear()
+        self.alerted_propagators.clear()
+
+    @contextmanager
+    def _active(self):
+        base = self.base
+        saved = {}
+        for key, (cell, content) in self.overlay.items():
+            saved[key] = (cell, cell.value)
+            cell.value = content
+
+        def content_changed(cell: Cell, previous: Any = None):
+            if id(cell) not in saved:
+                saved[id(cell)] = (cell, previous)
+            remember(cell.neighbors)
+            # Skips what subclasses do on changes, e.g., marking cells for snapshots.
+            history, cell.history = cell.history, None
+            Network.content_changed(base, cell, previous)
+            cell.history = history
+
+        # id(propagator) -> (propagator, inputs it last saw in the base)
+        memos: dict[int, tuple[Any, Any]] = {}
+
+        def remember(propagators):
+            # Only alerted propagators fire, so these are all that can change their memo.
+            for prop in propagators:
+                if hasattr(prop, 'last') and id(prop) not in memos:
+                    memos[id(prop)] = (prop, prop.last)
+
+        remember(self.alerted_propagators)
+        base_queue, base.alerted_propagators = base.alerted_propagators, self.alerted_propagators
+        base_stats, base.stats = base.stats, self.stats
+        # What-if changes are not reported to the base's watchers,
+        # recorded in its provenance or counted by its oscillation detector.
+        base_watches, base.watches = base.watches, {}
+        base_pending, base.pending_changes = base.pending_changes, {}
+        base_provenance, base.provenance = base.provenance, None
+        base_oscillation, base.oscillation = base.oscillation, None
+        # The fork's runs do not resume or end a run of the base.
+        base_resuming, base.resuming = base.resuming, False
+        # Shadow the methods for the duration of the fork's run.
+        base.content_changed = content_changed
+        if hasattr(base, 'publish'):
+            # Readers of a ConcurrentNetwork keep the base's last snapshot.
+            base.publish = base.snapshot
+        try:
+            yield
+        finally:
+            del base.content_changed
+            base.__dict__.pop('publish', None)
+            base.alerted_propagators = base_queue
+            base.stats = base_stats
+            base.watches = base_watches
+            base.pending_changes = base_pending
+            base.provenance = base_provenance
+            base.oscillation = base_oscillation
+            base.resuming = base_resuming
+            for key, (cell, value) in saved.items():
+                self.overlay[key] = (cell, cell.value)
+                cell.value = value
+            for prop, last in memos.values():
+                prop.last = last
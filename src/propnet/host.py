@@ -0,0 +1,168 @@
+"""
+Hosting many small, independent networks in one process or across processes.
+
+Networks are built by a builder function (e.g. ``fall_duration``) and are
+recycled after use: a released network is reset to the contents it had right
+after building and handed out again for the next job with the same builder.
+So the cells and propagators of a topology are built once per pool slot
+instead of once per job.
+
+All networks that are running share one round-robin scheduler which fires at
+most ``quantum`` propagators of a network before moving on to the next.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+import multiprocessing
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from . import Cell, Network, RunStatus, Stats
+
+Builder = Callable[[], Network]
+# (inputs, names of outputs)
+Job = tuple[Mapping[str, Any], Sequence[str]]
+
+
+@dataclass
+class _Pooled:
+    builder: Builder
+    net: Network
+    # Every cell with its content after building, including unnamed ones.
+    initial: list[tuple[Cell, Any]]
+
+
+def _initial(net: Network) -> list[tuple[Cell, Any]]:
+    # Like NetworkTemplate.capture, finds unnamed cells through the propagators.
+    cells = {id(cell): cell for cell in net.cells.values()}
+    for prop in net.propagators_ever_alerted:
+        cells.update((id(cell), cell) for cell in getattr(prop, 'cells', ()))
+    return [(cell, cell.value) for cell in cells.values()]
+
+
+def _reset(pooled: _Pooled):
+    net = pooled.net
+    for cell, content in pooled.initial:
+        cell.value = content
+        cell.refinements = 0
+        if cell.history is not None:
+            cell.track_history(cell.history.revisions.maxlen)
+    net.stats = Stats()
+    # Left set if the previous job failed in a propagator.
+    net.firing = None
+    # Records of the previous job must not leak into the next one.
+    if net.provenance is not None:
+        net.track_provenance(net.provenance.capacity)
+    if (oscillation := net.oscillation) is not None:
+        net.detect_oscillation(oscillation.window, oscillation.max_changes, oscillation.damp)
+    net.pending_changes.clear()
+    net.disbelieved.clear()
+    # Inputs seen in the previous job say nothing about this one.
+    net.forget_inputs()
+    net.alerted_propagators[:] = net.propagators_ever_alerted
+
+
+@dataclass
+class NetworkHost:
+    quantum: int = 64
+    batch: int = 64
+    _pools: dict[Builder, list[_Pooled]] = field(default_factory=dict, repr=False)
+    _checked_out: dict[int, _Pooled] = field(default_factory=dict, repr=False)
+    _scheduled: deque[Network] = field(default_factory=deque, repr=False)
+
+    def acquire(self, builder: Builder) -> Network:
+        pool = self._pools.setdefault(builder, [])
+        if pool:
+            pooled = pool.pop()
+        else:
+            net = builder()
+            pooled = _Pooled(builder, net, _initial(net))
+        self._checked_out[id(pooled.net)] = pooled
+        return pooled.net
+
+    def release(self, net: Network):
+        pooled = self._checked_out.pop(id(net))
+        _reset(pooled)
+        self._pools[pooled.builder].append(pooled)
+
+    def submit(self, net: Network):
+        self._scheduled.append(net)
+
+    def run(self) -> list[tuple[Network, Exception]]:
+        """Run all submitted networks until each of them is quiescent.
+
+        A network whose run raises, e.g., a Contradiction, is not run further.
+        Returns these networks with their errors.
+        """
+        failed = []
+        while self._scheduled:
+            net = self._scheduled.popleft()
+            try:
+                status = net.run(max_firings=self.quantum)
+            except Exception as err:
+                failed.append((net, err))
+                continue
+            if status is RunStatus.BUDGET_EXHAUSTED:
+                self._scheduled.append(net)
+        return failed
+
+    def solve_many(self, builder: Builder, jobs: Iterable[Job]) -> list[dict[str, Any] | Exception]:
+        """Run one network per job and return the requested outputs of each.
+
+        A job that fails, e.g., because its inputs contradict each other, gets
+        its error instead. At most ``batch`` networks are live at a time, so
+        the pool stays small.
+        """
+        jobs = list(jobs)
+        results = []
+        for start in range(0, len(jobs), self.batch):
+            # [net, outputs, error]
+            running: list[list] = []
+            try:
+                for inputs, outputs in jobs[start:start + self.batch]:
+                    net = self.acquire(builder)
+                    running.append([net, outputs, None])
+                    try:
+                        for name, content in inputs.items():
+                            net[name].add_content(content, net)
+                    except Exception as err:
+                        running[-1][2] = err
+                        continue
+                    self.submit(net)
+                errors = {id(net): err for net, err in self.run()}
+                for net, outputs, err in running:
+                    if (err := err or errors.get(id(net))) is not None:
+                        results.append(err)
+                    else:
+                        results.append({name: net[name].content() for name in outputs})
+            finally:
+                ids = {id(net) for net, _, _ in running}
+                if any(id(net) in ids for net in self._scheduled):
+                    self._scheduled = deque(net for net in self._scheduled if id(net) not in ids)
+                for net, _, _ in running:
+                    self.release(net)
+        return results
+
+
+# One host per worker process so that pools survive across chunks.
+_worker_host: NetworkHost | None = None
+
+
+def _solve_chunk(builder: Builder, jobs: list[Job]) -> list[dict[str, Any] | Exception]:
+    global _worker_host
+    if _worker_host is None:
+        _worker_host = NetworkHost()
+    return _worker_host.solve_many(builder, jobs)
+
+
+def solve_sharded(builder: Builder, jobs: Sequence[Job], processes: int | None = None,
+                  chunksize: int = 64) -> list[dict[str, Any] | Exception]:
+    """Like ``NetworkHost.solve_many`` but spreads jobs over worker processes.
+
+    ``builder``, the inputs and the outputs must be picklable,
+    i.e., ``builder`` must be a module-level function.
+    """
+    chunks = [list(jobs[i:i + chunksize]) for i in range(0, len(jobs), chunksize)]
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.starmap(_solve_chunk, [(builder, chunk) for chunk in chunks])
+    return [r for chunk in results for r in chunk]
@@ -0,0 +1,101 @@
+"""
+Demand-driven evaluation.
+
+A LazyNetwork is built like any other network but is not run as a whole.
+Instead, ``query`` fires only the alerted propagators that can contribute to
+the queried cell, i.e., the writers of the cell, the writers of their inputs,
+and so on. Everything else stays alerted until a query needs it.
+Since cells keep their contents, a repeated query returns immediately unless
+something in its dependency cone was alerted in the meantime.
+
+    net = LazyNetwork()
+    ...  # build as usual
+    net['fall_time'].add_content(Datum(Interval(2.9, 3.1)), net)
+    net.query('building_height')
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from . import Cell, Network, RunStatus, _reads, _writes
+
+
+@dataclass
+class LazyNetwork(Network):
+    # id(cell) -> propagators that write to it
+    _writers: dict[int, list[Callable]] = field(default_factory=dict, repr=False)
+    _indexed: int = field(default=0, repr=False)
+    # id(cell) -> ids of the propagators in its backward dependency cone
+    _cones: dict[int, set[int]] = field(default_factory=dict, repr=False)
+    # While querying: the cone and its alerted propagators by id, in alert order
+    _querying: tuple[set[int], dict[int, Callable]] | None = field(default=None, repr=False)
+
+    def _update_index(self):
+        if self._indexed == len(self.propagators_ever_alerted):
+            return
+        for prop in self.propagators_ever_alerted[self._indexed:]:
+            if not hasattr(prop, 'cells'):
+                raise ValueError(f"Cannot determine the cells of propagator {prop!r}")
+            for cell in _writes(prop):
+                self._writers.setdefault(id(cell), []).append(prop)
+        self._indexed = len(self.propagators_ever_alerted)
+        self._cones.clear()
+
+    def _cone(self, cell: Cell) -> set[int]:
+        self._update_index()
+        if (cone := self._cones.get(id(cell))) is not None:
+            return cone
+        cone = set()
+        visited = {id(cell)}
+        stack = [cell]
+        while stack:
+            for prop in self._writers.get(id(stack.pop()), ()):
+                if id(prop) in cone:
+                    continue
+                cone.add(id(prop))
+                for inp in _reads(prop):
+                    if id(inp) not in visited:
+                        visited.add(id(inp))
+                        stack.append(inp)
+        self._cones[id(cell)] = cone
+        return cone
+
+    def remove_propagators(self, *propagators: Callable):
+        super().remove_propagators(*propagators)
+        # The index assumes that propagators are only ever appended.
+        self._writers.clear()
+        self._indexed = 0
+        self._cones.clear()
+
+    def alert_propagator(self, *propagators):
+        if self._querying is None:
+            return super().alert_propagator(*propagators)
+        cone, ready = self._querying
+        for prop in propagators:
+            if id(prop) in cone:
+                ready.setdefault(id(prop), prop)
+            else:
+                super().alert_propagator(prop)
+
+    def query(self, name: str) -> Any:
+        """Propagate what is needed for the content of cell ``name`` and return it."""
+        cell = self[name]
+        cone = self._cone(cell)
+        ready = {id(prop): prop for prop in self.alerted_propagators if id(prop) in cone}
+        if ready:
+            self.alerted_propagators = [prop for prop in self.alerted_propagators
+                                        if id(prop) not in ready]
+        # Alerts inside the cone go to ready, so the global queue is scanned once.
+        self._querying = (cone, ready)
+        self.start_run()
+        try:
+            with self.worldview():
+                while ready:
+                    self.fire(ready.pop(next(iter(ready))))
+        finally:
+            self._querying = None
+            self.alerted_propagators.extend(ready.values())
+        self.finish_run(RunStatus.QUIESCENT)
+        self.notify()
+        return cell.content()
@@ -0,0 +1,144 @@
+"""
+Bulk solver for the linear parts of a network.
+
+Local propagation needs many steps to push values through chains of linear
+propagators and cannot solve simultaneous equations at all.
+``solve_linear`` collects the equations of all linear propagators, solves
+them with sparse Gauss-Jordan elimination and writes every determined cell
+back through ``Cell.add_content``.
+"""
+
+from __future__ import annotations
+import math
+
+from . import (Cell, Contradiction, Datum, Linear, Network, Support, adder, divider, multiplier,
+               subtractor)
+
+# Coefficients that cancel to this fraction of the terms they come from are 0.
+_EPS = 1e-12
+
+
+def _exact(content) -> bool:
+    if isinstance(content, Datum):
+        content = content.value
+    return isinstance(content, (int, float)) and not isinstance(content, bool)
+
+
+def _number(content) -> float:
+    return content.value if isinstance(content, Datum) else content
+
+
+def _premises(content) -> frozenset[str]:
+    return frozenset(content.support.sup) if isinstance(content, Datum) else frozenset()
+
+
+def _equation(prop) -> tuple[list[tuple[float, Cell]], float] | None:
+    """Return ``(terms, constant)`` such that ``sum(a * x for a, x in terms) == constant``."""
+    if isinstance(prop, Linear):
+        return list(zip(prop.coefficients, prop.cells)), prop.constant
+    func = getattr(prop, 'func', None)
+    if func is None:
+        return None
+    if func is adder.func:
+        a, b, out = prop.cells
+        return [(1, a), (1, b), (-1, out)], 0
+    if func is subtractor.func:
+        a, b, out = prop.cells
+        return [(1, a), (-1, b), (-1, out)], 0
+    if func is multiplier.func:
+        a, b, out = prop.cells
+        if not _exact(a.content()):
+            a, b = b, a
+        if not _exact(a.content()):
+            return None
+        return [(_number(a.content()), b), (-1, out)], 0
+    if func is divider.func:
+        a, b, out = prop.cells
+        if not _exact(b.content()) or _number(b.content()) == 0:
+            return None
+        return [(1 / _number(b.content()), a), (-1, out)], 0
+    return None
+
+
+def _eliminate(row, pivot_row, var):
+    # row -= row[var] * pivot_row, where pivot_row[var] == 1
+    coefs, rhs, premises = row
+    factor = coefs.pop(var)
+    pivot_coefs, pivot_rhs, pivot_premises = pivot_row
+    for v, c in pivot_coefs.items():
+        if v == var:
+            continue
+        old = coefs.get(v, 0)
+        new = old - factor * c
+        if abs(new) <= _EPS * max(abs(old), abs(factor * c)):
+            coefs.pop(v, None)
+        else:
+            coefs[v] = new
+    return coefs, rhs - factor * pivot_rhs, premises | pivot_premises
+
+
+def solve_linear(net: Network) -> int:
+    """Solve all linear propagators in ``net`` at once and return the number of solved cells.
+
+    Only cells that are empty or hold exact numbers (possibly wrapped in a Datum)
+    take part. Raises RuntimeError if the known values are inconsistent.
+    """
+    cells: dict[int, Cell] = {}
+    props = []
+    rows = []
+    use_datum = False
+    for prop in net.propagators_ever_alerted:
+        if (equation := _equation(prop)) is None:
+            continue
+        terms, constant = equation
+        contents = [cell.content() for _, cell in terms]
+        if not all(c is None or _exact(c) for c in contents):
+            continue
+        coefs: dict[int, float] = {}
+        premises = frozenset()
+        for (a, cell), content in zip(terms, contents):
+            if content is None:
+                cells[id(cell)] = cell
+                coefs[id(cell)] = coefs.get(id(cell), 0) + a
+            else:
+                constant -= a * _number(content)
+                premises |= _premises(content)
+                use_datum |= isinstance(content, Datum)
+        props.append(prop)
+        rows.append(({v: a for v, a in coefs.items() if a != 0}, constant, premises))
+
+    tolerance = 1e-9 * max([1.0] + [abs(rhs) for _, rhs, _ in rows])
+    # Gauss-Jordan elimination, pivots maps a variable to its row.
+    pivots: dict[int, tuple[dict[int, float], float, frozenset[str]]] = {}
+    for row in rows:
+        for var in [v for v in row[0] if v in pivots]:
+            row = _eliminate(row, pivots[var], var)
+        coefs, rhs, premises = row
+        if not coefs:
+            if abs(rhs) > tolerance:
+                raise Contradiction(f"Inconsistent linear equations, residual {rhs}")
+            continue
+        var = max(coefs, key=lambda v: abs(coefs[v]))
+        scale = coefs[var]
+        row = ({v: c / scale for v, c in coefs.items()}, rhs / scale, premises)
+        row[0][var] = 1.0
+        for other, pivot_row in pivots.items():
+            if var in pivot_row[0]:
+                pivots[other] = _eliminate(pivot_row, row, var)
+        pivots[var] = row
+
+    solved = 0
+    for var, (coefs, rhs, premises) in pivots.items():
+        if len(coefs) != 1 or not math.isfinite(rhs):
+            continue  # depends on free variables
+        value = Datum(rhs, Support(set(premises))) if use_datum else rhs
+        cells[var].add_content(value, net)
+        solved += 1
+
+    # Linear propagators are satisfied by the solution; firing them again would
+    # only reproduce it up to rounding.
+    for prop in props:
+        if prop in net.alerted_propagators and all(
+                cell.content() is not None for cell in prop.cells):
+            net.alerted_propagators.remove(prop)
+    return solved
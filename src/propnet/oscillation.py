@@ -0,0 +1,121 @@
+"""
+Detecting propagation that does not converge.
+
+While detection is on, every change of a cell's content is checked for two
+signs of a run that will not reach quiescence:
+
+- the content equals one of the cell's last ``window`` contents, e.g., when
+  a merge flips between equally informative supports, and
+- the cell changed more than ``max_changes`` times in one run, e.g., when
+  round-off lets a cycle narrow an interval by a few ulps per round.
+
+An Oscillation reports the cells that changed since the cycle began and the
+propagators that changed them. By default ``Network.run`` then stops and
+returns ``RunStatus.OSCILLATING``. With ``damp``, the run continues without
+firing those propagators and returns ``RunStatus.DAMPED`` instead of
+``RunStatus.QUIESCENT``.
+
+A run that stops at a limit, e.g., ``max_firings``, and is resumed by calling
+``run`` again counts as one run, both for ``max_changes`` and for damping.
+
+    net.detect_oscillation(window=8, max_changes=1000)
+    if net.run() is RunStatus.OSCILLATING:
+        print(net.oscillation.reports[-1])
+
+Contents are compared with ==, so contents that compare by identity only
+show up through the change count.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from . import Cell, RunStatus
+
+
+@dataclass(frozen=True)
+class Oscillation:
+    reason: str
+    cells: tuple[str, ...]
+    propagators: tuple[Callable, ...]
+
+    def __str__(self) -> str:
+        labels = ', '.join(getattr(p, 'label', type(p).__name__) for p in self.propagators)
+        return f"{self.reason} in {', '.join(self.cells)} by {labels or 'no propagator'}"
+
+
+@dataclass
+class OscillationDetector:
+    window: int = 8
+    max_changes: int | None = 1000
+    damp: bool = False
+    # Changes of all cells as (number, cell, writer), the most recent last.
+    recent: deque[tuple[int, Cell, Callable | None]] = field(default_factory=lambda: deque(maxlen=256))
+    # id(cell) -> (number of the change, content) of the cell's last contents
+    contents: dict[int, deque[tuple[int, Any]]] = field(default_factory=dict)
+    # id(cell) -> number of changes in the current run
+    counts: dict[int, int] = field(default_factory=dict)
+    # id(propagator) -> damped propagator
+    damped: dict[int, Callable] = field(default_factory=dict)
+    reports: list[Oscillation] = field(default_factory=list)
+    tripped: bool = False
+    changes: int = 0
+    # False while a run that stopped at a limit is resumed.
+    ended: bool = True
+
+    def start_run(self):
+        if self.ended:
+            self.counts.clear()
+            self.damped.clear()
+            self.tripped = False
+            self.ended = False
+
+    def finish(self, status: RunStatus) -> RunStatus:
+        """The status to return from a run call that ended with ``status``."""
+        if status.resumable:
+            return status
+        self.ended = True
+        if status is RunStatus.QUIESCENT and self.damped:
+            return RunStatus.DAMPED
+        return status
+
+    def record(self, net, cell: Cell, previous: Any):
+        self.changes += 1
+        key = id(cell)
+        self.recent.append((self.changes, cell, net.firing))
+        if (contents := self.contents.get(key)) is None:
+            contents = self.contents[key] = deque(maxlen=self.window)
+            if previous is not None:
+                contents.append((self.changes - 1, previous))
+        content = cell.value
+        count = self.counts[key] = self.counts.get(key, 0) + 1
+        # The previous content is never equal, start at the one before it.
+        for number, earlier in list(contents)[-2::-1]:
+            if earlier == content:
+                self._report(net, 'repeated content', number)
+                break
+        else:
+            if self.max_changes is not None and count > self.max_changes:
+                self._report(net, f'{count} changes', contents[0][0])
+        contents.append((self.changes, content))
+
+    def forget(self, cell: Cell):
+        self.contents.pop(id(cell), None)
+        self.counts.pop(id(cell), None)
+
+    def _report(self, net, reason: str, since: int):
+        names = {id(cell): name for name, cell in net.cells.items()}
+        cells: dict[int, str] = {}
+        writers: dict[int, Callable] = {}
+        for number, cell, writer in self.recent:
+            if number > since:
+                cells.setdefault(id(cell), names.get(id(cell), '<cell>'))
+                if writer is not None:
+                    writers.setdefault(id(writer), writer)
+        self.reports.append(Oscillation(reason, tuple(cells.values()), tuple(writers.values())))
+        if self.damp:
+            self.damped.update(writers)
+            net.alerted_propagators = [p for p in net.alerted_propagators if id(p) not in self.damped]
+        else:
+            self.tripped = True
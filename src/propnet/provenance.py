@@ -0,0 +1,160 @@
+"""
+Explaining how a cell's content was derived.
+
+While provenance is tracked, every write to a cell stores a compact record:
+the propagator that wrote it and the versions its input cells had at the time.
+Contents of intermediate versions are not retained. ``Network.explain`` turns
+the records into a derivation DAG on demand, following inputs only when they
+are accessed.
+
+    net.track_provenance(capacity=16)
+    net.run()
+    print(net.explain('building_height'))
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable
+
+from . import Cell, _reads
+
+
+@dataclass(frozen=True)
+class _Record:
+    version: int
+    # None if the content was added from outside a run.
+    writer: Callable | None
+    # (id(cell), version) of the writer's other cells
+    inputs: tuple[tuple[int, int], ...]
+
+
+def _inputs_of(writer, cell: Cell) -> tuple[Cell, ...]:
+    # A Constraint reads the cell it writes as well.
+    return tuple(c for c in _reads(writer) if c is not cell)
+
+
+@dataclass
+class Provenance:
+    # Number of records kept per cell, older versions cannot be explained.
+    capacity: int = 16
+    versions: dict[int, int] = field(default_factory=dict)
+    records: dict[int, deque[_Record]] = field(default_factory=dict)
+    # The propagator that is firing and the versions of its cells when it started.
+    started: tuple[Callable | None, dict[int, int]] = (None, {})
+
+    def begin(self, writer: Callable):
+        # A Constraint writes several cells, each computed from the versions before its firing.
+        self.started = (writer, {id(c): self.versions.get(id(c), 0) for c in getattr(writer, 'cells', ())})
+
+    def record(self, cell: Cell, writer: Callable | None):
+        key = id(cell)
+        versions = self.started[1] if writer is not None and self.started[0] is writer else self.versions
+        inputs = () if writer is None else tuple(
+            (id(c), versions.get(id(c), 0)) for c in _inputs_of(writer, cell))
+        version = self.versions.get(key, 0) + 1
+        self.versions[key] = version
+        if (records := self.records.get(key)) is None:
+            records = self.records[key] = deque(maxlen=self.capacity)
+        records.append(_Record(version, writer, inputs))
+
+    def forget(self, cell: Cell):
+        # Ids are reused once the cell is freed.
+        self.versions.pop(id(cell), None)
+        self.records.pop(id(cell), None)
+
+    def lookup(self, key: int, version: int) -> _Record | None:
+        for record in self.records.get(key, ()):
+            if record.version == version:
+                return record
+        return None
+
+
+class Derivation:
+    """A node in the derivation DAG: one version of one cell."""
+
+    def __init__(self, explainer: _Explainer, key: int, version: int) -> None:
+        self._explainer = explainer
+        self._key = key
+        self.version = version
+        self.cell: Cell = explainer.cells[key]
+        self.name: str | None = explainer.names.get(key)
+        self.record: _Record | None = explainer.provenance.lookup(key, version)
+
+    @property
+    def content(self) -> Any:
+        """Only the current version's content is available."""
+        if self.version == self._explainer.provenance.versions.get(self._key, 0):
+            return self.cell.value
+        return None
+
+    @property
+    def propagator(self) -> Callable | None:
+        return None if self.record is None else self.record.writer
+
+    @property
+    def given(self) -> bool:
+        """True if the content was initial or added from outside a run."""
+        return self.version == 0 or (self.record is not None and self.record.writer is None)
+
+    @cached_property
+    def inputs(self) -> tuple[Derivation, ...]:
+        if self.record is None:
+            return ()
+        return tuple(self._explainer.node(key, version) for key, version in self.record.inputs)
+
+    def __str__(self) -> str:
+        lines = []
+        self._format(lines, 0, set())
+        return '\n'.join(lines)
+
+    def _format(self, lines: list[str], depth: int, seen: set[tuple[int, int]]):
+        if self.version == 0:
+            how = 'initial'
+        elif self.record is None:
+            how = 'unknown (record dropped)'
+        elif self.record.writer is None:
+            how = 'given'
+        else:
+            how = f'by {getattr(self.record.writer, "label", type(self.record.writer).__name__)}'
+        content = '' if self.content is None else f' = {self.content}'
+        lines.append(f'{"  " * depth}{self.name or "<cell>"} v{self.version}{content} {how}')
+        if (self._key, self.version) in seen:
+            return
+        seen.add((self._key, self.version))
+        for node in self.inputs:
+            node._format(lines, depth + 1, seen)
+
+
+class _Explainer:
+    # Shares nodes between paths of one explanation so that it is a DAG.
+
+    def __init__(self, net, provenance: Provenance) -> None:
+        self.provenance = provenance
+        self.names = {id(cell): name for name, cell in net.cells.items()}
+        self.cells = {id(cell): cell for cell in net.cells.values()}
+        self.nodes: dict[tuple[int, int], Derivation] = {}
+
+    def node(self, key: int, version: int) -> Derivation:
+        if (key, version) not in self.nodes:
+            if key not in self.cells:
+                self._find_cell(key)
+            self.nodes[key, version] = Derivation(self, key, version)
+        return self.nodes[key, version]
+
+    def _find_cell(self, key: int):
+        # Cells that are not registered in the network are only reachable via propagators.
+        for records in self.provenance.records.values():
+            for record in records:
+                for cell in getattr(record.writer, 'cells', ()):
+                    self.cells.setdefault(id(cell), cell)
+        self.cells.setdefault(key, Cell())
+
+
+def explain(net, name: str) -> Derivation:
+    if net.provenance is None:
+        raise RuntimeError("Provenance is not tracked, call Network.track_provenance first")
+    cell = net[name]
+    explainer = _Explainer(net, net.provenance)
+    return explainer.node(id(cell), net.provenance.versions.get(id(cell), 0))
@@ -0,0 +1,169 @@
+"""
+Monte Carlo samples as cell content.
+
+A Samples content holds one value per simulated world in a NumPy array.
+Index i refers to the same world in every cell, so elementwise arithmetic
+keeps the correlations between quantities and one ``Network.run`` propagates
+all worlds at once. Inputs drawn independently are independent.
+
+Worlds are never removed from the arrays, only marked as dead. A world dies
+when it is rejected by a merge or when an operation is undefined in it, e.g.,
+the square root of a negative value. Dead worlds spread through arithmetic,
+so conditioning one cell eventually conditions all cells computed from it.
+
+Merging conditions on the other content by rejection. Merging with an
+Interval rejects the worlds whose value lies outside of it. Merging with a
+number or with other Samples of the same quantity rejects the worlds in which
+the values differ by more than ``Samples.rel_tol``. A number then replaces
+the values, other Samples do not.
+
+    t = Samples.normal(3.0, 0.05)
+    g = Samples.uniform(9.789, 9.832)
+    print(0.5 * g * t ** 2)
+
+Requires NumPy, which is an optional dependency of propnet.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+
+from . import Contradiction, Interval
+
+_rng = np.random.default_rng()
+
+
+@dataclass(frozen=True, eq=False)
+class Samples:
+    values: np.ndarray
+    # Worlds that are consistent with everything merged so far, all if None.
+    alive: np.ndarray | None = field(default=None, repr=False)
+
+    # Number of worlds drawn by the constructors below.
+    size = 20_000
+    # Relative difference up to which two values of a quantity agree in a world.
+    rel_tol = 1e-2
+
+    def __post_init__(self):
+        values = np.broadcast_to(np.asarray(self.values, dtype=float), (self._size(),))
+        alive = np.isfinite(values)
+        if self.alive is not None:
+            alive &= self.alive
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'alive', alive)
+
+    def _size(self) -> int:
+        values = np.asarray(self.values)
+        if values.ndim:
+            return len(values)
+        return Samples.size if self.alive is None else len(self.alive)
+
+    @staticmethod
+    def normal(mean: float, std: float, size: int | None = None, rng=None) -> Samples:
+        return Samples((rng or _rng).normal(mean, std, size or Samples.size))
+
+    @staticmethod
+    def uniform(lo: float, hi: float, size: int | None = None, rng=None) -> Samples:
+        return Samples((rng or _rng).uniform(lo, hi, size or Samples.size))
+
+    @cached_property
+    def live(self) -> np.ndarray:
+        """Values of the worlds that are alive."""
+        return self.values[self.alive]
+
+    @property
+    def count(self) -> int:
+        return len(self.live)
+
+    @property
+    def mean(self) -> float:
+        return float(self.live.mean())
+
+    @property
+    def std(self) -> float:
+        return float(self.live.std())
+
+    def quantile(self, q):
+        return np.quantile(self.live, q)
+
+    def interval(self, coverage: float = 1.0) -> Interval:
+        """The central interval holding ``coverage`` of the live values."""
+        if coverage == 1.0:
+            return Interval(float(self.live.min()), float(self.live.max()))
+        lo, hi = self.quantile([(1 - coverage) / 2, (1 + coverage) / 2])
+        return Interval(float(lo), float(hi))
+
+    def _apply(self, op, other, reverse=False):
+        if isinstance(other, Samples):
+            values, alive = other.values, self.alive & other.alive
+        elif isinstance(other, (int, float)):
+            values, alive = other, self.alive
+        else:
+            return NotImplemented
+        with np.errstate(all='ignore'):
+            result = op(values, self.values) if reverse else op(self.values, values)
+        return Samples(result, alive)
+
+    def __add__(self, other):
+        return self._apply(np.add, other)
+
+    def __radd__(self, other):
+        return self._apply(np.add, other, reverse=True)
+
+    def __sub__(self, other):
+        return self._apply(np.subtract, other)
+
+    def __rsub__(self, other):
+        return self._apply(np.subtract, other, reverse=True)
+
+    def __mul__(self, other):
+        return self._apply(np.multiply, other)
+
+    def __rmul__(self, other):
+        return self._apply(np.multiply, other, reverse=True)
+
+    def __truediv__(self, other):
+        return self._apply(np.divide, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(np.divide, other, reverse=True)
+
+    def __pow__(self, power):
+        if isinstance(power, Samples):
+            return self._apply(np.power, power)
+        with np.errstate(all='ignore'):
+            return Samples(np.power(self.values, power), self.alive)
+
+    def __neg__(self):
+        return Samples(-self.values, self.alive)
+
+    def sqrt(self) -> Samples:
+        # Worlds with negative values die, their square root is nan.
+        with np.errstate(invalid='ignore'):
+            return Samples(np.sqrt(self.values), self.alive)
+
+    def merge(self, other) -> Samples:
+        values = self.values
+        if isinstance(other, Interval):
+            alive = self.alive & (values >= other.lo) & (values <= other.hi)
+        elif isinstance(other, (int, float)):
+            alive = self.alive & np.isclose(values, other, rtol=self.rel_tol, atol=0.0)
+            if not (values == other).all():
+                values = np.full_like(values, other)
+        elif isinstance(other, Samples):
+            alive = self.alive & other.alive & np.isclose(values, other.values, rtol=self.rel_tol, atol=0.0)
+        else:
+            raise TypeError(f"Cannot merge {other!r} into samples")
+        if not alive.any():
+            raise Contradiction("no samples left")
+        if values is self.values and np.array_equal(alive, self.alive):
+            return self
+        return Samples(values, alive)
+
+    def implies(self, other) -> bool:
+        return self is self.merge(other)
+
+    def __str__(self) -> str:
+        return f"{self.mean:.6g} ± {self.std:.3g} ({self.count} samples)"
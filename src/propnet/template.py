@@ -0,0 +1,120 @@
+"""
+Cheap copies of a network topology.
+
+A NetworkTemplate captures a built network once. Its propagators are turned
+into kernels that refer to cells by index and are shared by all copies, as are
+the neighbor lists. Instantiating a template only allocates the cells and
+their contents.
+
+    template = NetworkTemplate.capture(fall_duration())
+    net = template.instantiate()
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from . import Cell, Constraint, Network
+
+
+@dataclass(eq=False)
+class _Apply:
+    # A propagator made by make_propagator.
+    func: Callable
+    inputs: tuple[int, ...]
+    output: int
+
+    def fire(self, net: TemplateNetwork):
+        cells = net.cell_list
+        values = [cells[i].value for i in self.inputs]
+        if any(v is None for v in values):
+            return
+        cells[self.output].add_content(self.func(*values), net)
+
+
+@dataclass(eq=False)
+class _Revise:
+    # A Constraint, its revise method does not depend on the cell objects.
+    constraint: Constraint
+    indices: tuple[int, ...]
+
+    def fire(self, net: TemplateNetwork):
+        cells = net.cell_list
+        values = [cells[i].value for i in self.indices]
+        for i, value in zip(self.indices, self.constraint.revise(values)):
+            cells[i].add_content(value, net)
+
+
+@dataclass
+class TemplateNetwork(Network):
+    """A copy of a NetworkTemplate, its topology cannot be extended."""
+    cell_list: list[Cell] = field(default_factory=list, repr=False)
+
+    def add_cell(self, name: str, cell: Cell):
+        raise TypeError("Cannot add cells to a TemplateNetwork, capture a new template instead")
+
+    def alert_propagator(self, *propagators):
+        for prop in propagators:
+            if not isinstance(prop, (_Apply, _Revise)):
+                raise TypeError("Cannot add propagators to a TemplateNetwork, capture a new template instead")
+        super().alert_propagator(*propagators)
+
+    def fire(self, kernel):
+        self.stats.firings += 1
+        self.firing = kernel
+        kernel.fire(self)
+        self.firing = None
+
+
+@dataclass(frozen=True)
+class NetworkTemplate:
+    # Cells that are not registered in the network have a name of None.
+    names: tuple[str | None, ...]
+    initial: tuple[Any, ...]
+    neighbors: tuple[tuple[Any, ...], ...]
+    alerted: tuple[Any, ...]
+
+    @staticmethod
+    def capture(net: Network) -> NetworkTemplate:
+        """Capture the topology and current contents of ``net``.
+
+        Only propagators made by make_propagator and Constraints can be captured.
+        """
+        index: dict[int, int] = {}
+        cells: list[Cell] = []
+        names: list[str | None] = []
+
+        def index_of(cell: Cell, name: str | None = None) -> int:
+            if id(cell) not in index:
+                index[id(cell)] = len(cells)
+                cells.append(cell)
+                names.append(name)
+            return index[id(cell)]
+
+        for name, cell in net.cells.items():
+            index_of(cell, name)
+
+        kernels: dict[int, Any] = {}
+        for prop in net.propagators_ever_alerted:
+            if isinstance(prop, Constraint):
+                kernel = _Revise(prop, tuple(index_of(c) for c in prop.cells))
+            elif hasattr(prop, 'func') and hasattr(prop, 'cells'):
+                *inputs, output = (index_of(c) for c in prop.cells)
+                kernel = _Apply(prop.func, tuple(inputs), output)
+            else:
+                raise ValueError(f"Cannot capture propagator {prop!r}")
+            kernels[id(prop)] = kernel
+
+        return NetworkTemplate(
+            names=tuple(names),
+            initial=tuple(cell.value for cell in cells),
+            neighbors=tuple(tuple(kernels[id(p)] for p in cell.neighbors) for cell in cells),
+            alerted=tuple(kernels[id(p)] for p in net.alerted_propagators),
+        )
+
+    def instantiate(self) -> TemplateNetwork:
+        # The neighbor tuples are shared, TemplateNetwork refuses new cells and propagators.
+        cell_list = list(map(Cell, self.initial, self.neighbors))
+        net = TemplateNetwork(cell_list=cell_list, alerted_propagators=list(self.alerted))
+        net.cells = {name: cell for name, cell in zip(self.names, cell_list) if name is not None}
+        return net
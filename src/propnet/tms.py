@@ -0,0 +1,147 @@
+"""
+Truth maintenance systems as cell content.
+
+A TMS holds several Datums of one quantity, each derived from different
+premises. Merging keeps every Datum that is not subsumed by another one, i.e.,
+implied by one with fewer premises. Operations apply to the strongest
+consequence of the Datums that are currently believed, so their results only
+depend on believed premises.
+
+Each network has its own worldview: premises are believed unless kicked out of
+it. While a network runs, contents believe what it believes; elsewhere all
+premises are believed unless inside ``Network.worldview()``. Changing the
+worldview re-fires all propagators of the network, which can then be run again.
+
+    net['fall_time'].add_content(TMS.premise(Interval(2.9, 3.1), 'fall_time'), net)
+    net.run()
+    kick_out('fall_time', net)
+    net.run()
+    with net.worldview():
+        print(net['building_height'])
+
+Section 4.2
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+from . import Contradiction, Datum, Network, Support, _disbelieved, implies, sqrt
+
+
+def is_believed(datum: Datum) -> bool:
+    return _disbelieved.get().isdisjoint(datum.support.sup)
+
+
+def subsumes(a: Datum, b: Datum) -> bool:
+    """True if ``a`` says at least as much as ``b`` from a subset of its premises."""
+    try:
+        return implies(a.value, b.value) and a.support.sup <= b.support.sup
+    except Contradiction:
+        return False
+
+
+def _lift(x) -> TMS:
+    if isinstance(x, TMS):
+        return x
+    return TMS(frozenset({x if isinstance(x, Datum) else Datum(x)}))
+
+
+@dataclass(frozen=True)
+class TMS:
+    values: frozenset[Datum]
+
+    @staticmethod
+    def premise(value, *premises: str) -> TMS:
+        return TMS(frozenset({Datum(value, Support(set(premises)))}))
+
+    def merge(self, other) -> TMS:
+        # Consequences depend on the worldview, so they are not stored.
+        merged = self.assimilate(_lift(other))
+        return self if merged.values == self.values else merged
+
+    def implies(self, other) -> bool:
+        return self is self.merge(other)
+
+    def assimilate(self, other: TMS) -> TMS:
+        result = self
+        for datum in other.values:
+            result = result.assimilate_one(datum)
+        return result
+
+    def assimilate_one(self, datum: Datum) -> TMS:
+        if any(subsumes(d, datum) for d in self.values):
+            return self
+        return TMS(frozenset({d for d in self.values if not subsumes(datum, d)} | {datum}))
+
+    def strongest_consequence(self) -> Datum | None:
+        result = None
+        for datum in self.values:
+            if not is_believed(datum):
+                continue
+            try:
+                result = datum if result is None else result.merge(datum)
+            except Contradiction as e:
+                nogood = result.support.merge(datum.support).sup
+                raise Contradiction(f"{e}, nogood: {{{', '.join(sorted(nogood))}}}") from e
+        return result
+
+    def _apply(self, op, *others):
+        args = []
+        for x in (self, *others):
+            if isinstance(x, TMS):
+                if (x := x.strongest_consequence()) is None:
+                    return None
+            elif not isinstance(x, Datum):
+                x = Datum(x)
+            args.append(x)
+        return TMS(frozenset({op(*args)}))
+
+    def __add__(self, other):
+        return self._apply(lambda a, b: a + b, other)
+
+    def __radd__(self, other):
+        return self._apply(lambda a, b: b + a, other)
+
+    def __sub__(self, other):
+        return self._apply(lambda a, b: a - b, other)
+
+    def __rsub__(self, other):
+        return self._apply(lambda a, b: b - a, other)
+
+    def __mul__(self, other):
+        return self._apply(lambda a, b: a * b, other)
+
+    def __rmul__(self, other):
+        return self._apply(lambda a, b: b * a, other)
+
+    def __truediv__(self, other):
+        return self._apply(lambda a, b: a / b, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(lambda a, b: b / a, other)
+
+    def __pow__(self, power):
+        return self._apply(lambda a, b: a ** b, power)
+
+    def sqrt(self):
+        return self._apply(sqrt)
+
+    def __str__(self) -> str:
+        consequence = self.strongest_consequence()
+        return 'nothing' if consequence is None else str(consequence)
+
+
+def _reconsider(net: Network):
+    # Strongest consequences changed, so inputs that look unchanged are not.
+    net.forget_inputs()
+    net.alert_propagator(*net.propagators_ever_alerted)
+
+
+def kick_out(premise: str, net: Network):
+    net.disbelieved.add(premise)
+    _reconsider(net)
+
+
+def bring_in(premise: str, net: Network):
+    net.disbelieved.discard(premise)
+    _reconsider(net)
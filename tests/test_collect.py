@@ -0,0 +1,28 @@
+from propnet import Cell, ConcurrentNetwork, Network, adder
+
+
+def test_collect_removes_dead_cells_and_their_propagators():
+    for cls in (Network, ConcurrentNetwork):
+        net = cls()
+        a, b, out = (net.add_cell(name, Cell()) for name in ('a', 'b', 'out'))
+        adder(a, b, out, net=net)
+        c, d = net.add_cell('c', Cell()), net.add_cell('d', Cell())
+        adder(c, Cell(1), d, net=net)
+        assert net.collect('out') == (2, 1)
+        assert set(net.cells) == {'a', 'b', 'out'}
+        assert len(net.propagators_ever_alerted) == 1
+        a.add_content(1, net)
+        b.add_content(2, net)
+        net.run()
+        assert net['out'].value == 3
+
+
+def test_remove_cells():
+    net = ConcurrentNetwork()
+    cells = [net.add_cell(f'x{i}', Cell()) for i in range(4)]
+    for x, y in zip(cells, cells[1:]):
+        adder(x, Cell(1), y, net=net)
+    net.remove_cells('x1', 'x2')
+    assert set(net.cells) == {'x0', 'x3'}
+    assert net.propagators_ever_alerted == []
+    assert set(net.snapshot().contents) == {'x0', 'x3'}
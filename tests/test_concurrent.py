@@ -0,0 +1,29 @@
+from propnet import Cell, ConcurrentNetwork, adder
+
+
+def chain(n: int, **options) -> ConcurrentNetwork:
+    net = ConcurrentNetwork(**options)
+    prev = net.add_cell('x0', Cell())
+    for i in range(1, n):
+        cell = net.add_cell(f'x{i}', Cell())
+        adder(prev, Cell(1), cell, net=net)
+        prev = cell
+    return net
+
+
+def test_publishes_in_batches_and_at_the_end():
+    net = chain(200)
+    epoch = net.snapshot().epoch
+    net.add_content('x0', 0)
+    net.run()
+    assert net.snapshot()['x199'] == 199
+    # One snapshot for add_content, few during the run, one at its end.
+    assert net.snapshot().epoch - epoch <= 5
+
+
+def test_publish_every():
+    net = chain(20, publish_every=1)
+    epoch = net.snapshot().epoch
+    net.add_content('x0', 0)
+    net.run()
+    assert net.snapshot().epoch - epoch == 20
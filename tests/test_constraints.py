@@ -0,0 +1,74 @@
+import pytest
+
+from propnet import (Cell, Contradiction, Datum, Interval, Network, Support, linear, nary_product,
+                     nary_sum)
+
+
+def cells(net: Network, names: str) -> list[Cell]:
+    return [net.add_cell(name, Cell()) for name in names]
+
+
+def test_linear_solves_for_the_missing_cell():
+    net = Network()
+    x, y, z = cells(net, 'xyz')
+    linear([1, 2, -1], [x, y, z], 3, net)
+    x.add_content(1, net)
+    z.add_content(4, net)
+    net.run()
+    assert y.value == 3
+
+
+def test_linear_with_one_empty_cell():
+    net = Network()
+    (x,) = cells(net, 'x')
+    linear([2], [x], 4, net)
+    net.run()
+    assert x.value == 2
+
+
+def test_linear_lifts_constants_to_datums():
+    net = Network()
+    x, y = cells(net, 'xy')
+    linear([2, 1], [x, y], 10, net)
+    x.add_content(Datum(Interval(1, 2), Support('x')), net)
+    net.run()
+    assert y.value.support.sup == {'x'}
+    assert y.value.value.lo <= 6 and y.value.value.hi >= 8
+
+
+def test_linear_detects_contradictions():
+    net = Network()
+    x, total = cells(net, 'xt')
+    nary_sum([x, Cell(2)], total, net)
+    x.add_content(1, net)
+    total.add_content(4, net)
+    with pytest.raises(Contradiction):
+        net.run()
+
+
+def test_empty_sum_and_product():
+    net = Network()
+    s, p = cells(net, 'sp')
+    nary_sum([], s, net)
+    nary_product([], p, net)
+    net.run()
+    assert (s.value, p.value) == (0, 1)
+
+
+def test_product_in_every_direction():
+    net = Network()
+    a, b, c, total = cells(net, 'abct')
+    nary_product([a, b, c], total, net)
+    a.add_content(2, net)
+    b.add_content(3, net)
+    c.add_content(4, net)
+    net.run()
+    assert total.value == 24
+    net = Network()
+    a, b, c, total = cells(net, 'abct')
+    nary_product([a, b, c], total, net)
+    a.add_content(2, net)
+    c.add_content(4, net)
+    total.add_content(24, net)
+    net.run()
+    assert b.value == 3
@@ -0,0 +1,51 @@
+from propnet import Cell, Convergence, Interval, Network, make_propagator
+
+# Each firing narrows the output to the middle half of the input.
+halve = make_propagator(lambda x: Interval(x.lo + (x.hi - x.lo) / 4, x.hi - (x.hi - x.lo) / 4),
+                        'halve')
+
+
+def shrinking(convergence: Convergence) -> tuple[Network, Cell]:
+    # h narrows itself until the policy calls the narrowing negligible.
+    net = Network(convergence=convergence)
+    h = net.add_cell('h', Cell())
+    halve(h, h, net=net)
+    return net, h
+
+
+def test_max_refinements_caps_each_run():
+    net, h = shrinking(Convergence(max_refinements=2))
+    h.add_content(Interval(0, 160), net)
+    net.run()
+    assert h.value == Interval(60, 100)
+    h.add_content(Interval(70, 100), net)
+    net.run()
+    assert h.value == Interval(81.25, 88.75)
+
+
+def test_outside_writes_are_not_capped():
+    net, h = shrinking(Convergence(max_refinements=2))
+    h.add_content(Interval(0, 160), net)
+    net.run()
+    h.add_content(Interval(80, 80), net)
+    assert h.value == Interval(80, 80)
+
+
+def test_resumed_run_keeps_its_count():
+    net, h = shrinking(Convergence(max_refinements=2))
+    h.add_content(Interval(0, 160), net)
+    while not net.run(max_firings=1).quiescent:
+        pass
+    assert h.value == Interval(60, 100)
+
+
+def test_tolerances():
+    net, h = shrinking(Convergence(abs_tol=10))
+    h.add_content(Interval(0, 160), net)
+    net.run()
+    # Halving [60, 100] would only shrink the width by 20 - 10.
+    assert h.value.hi - h.value.lo == 20
+    net, h = shrinking(Convergence(rel_tol=0.6))
+    h.add_content(Interval(0, 160), net)
+    net.run()
+    assert h.value == Interval(0, 160)
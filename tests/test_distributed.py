@@ -0,0 +1,68 @@
+import pytest
+
+from propnet import Cell, Network, adder
+from propnet.distributed import COORDINATOR, _worker, run_distributed
+
+
+def link(a: str, b: str) -> Network:
+    # b = a + 1
+    net = Network()
+    adder(net.add_cell(a, Cell()), Cell(1), net.add_cell(b, Cell()), net=net)
+    return net
+
+
+def first():
+    return link('a', 'b')
+
+
+def middle():
+    return link('b', 'c')
+
+
+def broken():
+    raise ValueError("cannot build")
+
+
+class Inbox:
+    """Hands out one message per round."""
+
+    def __init__(self, *messages):
+        self.messages = list(messages)
+
+    def get(self):
+        return self.messages.pop(0)
+
+    def empty(self):
+        return True
+
+
+class Outbox(list):
+    put = list.append
+
+
+def test_update_before_start_is_forwarded():
+    inbox = Inbox(('update', 0, {'b': 1}),
+                  ('start', COORDINATOR, {}, {'b': [0], 'c': [2]}),
+                  ('stop',))
+    peers, coordinator = [Outbox(), inbox, Outbox()], Outbox()
+    _worker(1, middle, peers, coordinator)
+    assert ('update', 1, {'c': 2}) in peers[2]
+
+
+def test_chain():
+    assert run_distributed([first, middle], {'a': 1}, ['c'], timeout=30) == {'c': 3}
+
+
+def test_failing_builder():
+    with pytest.raises(RuntimeError, match="cannot build"):
+        run_distributed([first, broken], {'a': 1}, ['c'], timeout=30)
+
+
+def test_update_is_not_sent_back():
+    inbox = Inbox(('start', COORDINATOR, {}, {'b': [0], 'c': [2]}),
+                  ('update', 0, {'b': 1}),
+                  ('stop',))
+    peers, coordinator = [Outbox(), inbox, Outbox()], Outbox()
+    _worker(1, middle, peers, coordinator)
+    assert not [msg for msg in peers[0] if msg[0] == 'update']
+    assert ('update', 1, {'c': 2}) in peers[2]
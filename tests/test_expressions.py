@@ -0,0 +1,46 @@
+from fractions import Fraction
+import math
+import random
+
+import pytest
+
+from propnet import Cell, Contradiction, Datum, Interval, Network, equation, var
+from propnet.expressions import _inverse_pow
+
+
+@pytest.mark.parametrize('n', [2, 3, 4, 5, 7])
+def test_roots_enclose_the_exact_root(n):
+    rng = random.Random(n)
+    xs = [1e300, 1e90, 1e-90, 2.7e151, 8.0, 27.0, 2.0, 5e-324, 1.7e308]
+    xs += [10 ** rng.uniform(-300, 300) for _ in range(200)]
+    for x in xs:
+        root = _inverse_pow(Interval(x, x), Interval(0, math.inf), n)
+        assert Fraction(root.lo) ** n <= Fraction(x) <= Fraction(root.hi) ** n, x
+        assert root.hi - root.lo <= 4 * math.ulp(root.hi)
+
+
+def test_odd_roots_of_negative_numbers():
+    root = _inverse_pow(Interval(-1e300, -1e90), Interval(-math.inf, math.inf), 3)
+    assert Fraction(root.lo) ** 3 <= Fraction(-1e300) and Fraction(root.hi) ** 3 >= Fraction(-1e90)
+
+
+def test_even_roots_keep_the_sign_of_the_base():
+    root = _inverse_pow(Interval(16, 81), Interval(-math.inf, 0), 4)
+    assert root.lo <= -3 <= -2 <= root.hi < 0
+
+
+def test_equation_narrows_both_ways():
+    net = Network()
+    x, y = net.add_cell('x', Cell()), net.add_cell('y', Cell())
+    equation(var(x) ** 3, var(y), net=net)
+    x.add_content(Datum(Interval(0, 100)), net)
+    y.add_content(Datum(Interval(1e300, 1e300)), net)
+    with pytest.raises(Contradiction):
+        net.run()
+    net = Network()
+    x, y = net.add_cell('x', Cell()), net.add_cell('y', Cell())
+    equation(var(x) ** 3, var(y), net=net)
+    x.add_content(Datum(Interval(0, 1e101)), net)
+    y.add_content(Datum(Interval(1e300, 1e300)), net)
+    net.run()
+    assert x.value.value.lo <= 1e100 <= x.value.value.hi
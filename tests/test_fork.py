@@ -0,0 +1,56 @@
+from propnet import Cell, ConcurrentNetwork, Network, adder
+
+
+def increment(net: Network) -> Network:
+    adder(net.add_cell('a', Cell()), Cell(1), net.add_cell('b', Cell()), net=net)
+    net.run()
+    return net
+
+
+def test_fork_is_not_published():
+    net = increment(ConcurrentNetwork())
+    f = net.fork()
+    f.add_content('a', 41)
+    f.run()
+    assert f.content('b') == 42
+    assert dict(net.snapshot().contents) == {'a': None, 'b': None}
+    f.merge_back()
+    net.run()
+    assert dict(net.snapshot().contents) == {'a': 41, 'b': 42}
+
+
+def test_fork_is_not_recorded():
+    net = increment(Network())
+    net.track_provenance()
+    net.detect_oscillation()
+    f = net.fork()
+    f.add_content('a', 41)
+    f.run()
+    assert net.explain('b').version == 0
+    assert net.oscillation.changes == 0
+
+
+def test_base_keeps_its_pending_work():
+    net = increment(Network())
+    net.add_cell('c', Cell())
+    net['a'].add_content(1, net)
+    f = net.fork()
+    f.add_content('c', 5)
+    f.run()
+    assert f.content('b') == 2
+    net.run()
+    assert net['b'].value == 2
+    assert net.stats.skipped == 0
+
+
+def test_fork_is_not_in_histories():
+    net = increment(Network())
+    net.track_history(4)
+    f = net.fork()
+    f.add_content('a', 41)
+    f.run()
+    assert len(net['a'].history) == 0
+    assert len(net['b'].history) == 0
+    f.merge_back()
+    net.run()
+    assert [r.content for r in net['b'].history] == [42]
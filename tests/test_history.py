@@ -0,0 +1,52 @@
+from propnet import Cell, Datum, Interval, Network, Support, adder
+
+
+def increment(one=1) -> tuple[Network, Cell, Cell]:
+    net = Network()
+    a, b = net.add_cell('a', Cell()), net.add_cell('b', Cell())
+    adder(a, Cell(one), b, net=net)
+    return net, a, b
+
+
+def test_nothing_is_recorded_by_default():
+    net, a, b = increment()
+    a.add_content(1, net)
+    net.run()
+    assert a.history is None and b.history is None
+
+
+def test_track_history_records_the_current_content():
+    net, a, b = increment()
+    a.add_content(1, net)
+    net.track_history(4, 'a')
+    assert [(r.version, r.content, r.writer) for r in a.history] == [(1, 1, None)]
+    assert b.history is None
+
+
+def test_versions_and_writers():
+    net, a, b = increment(Datum(1))
+    net.track_history(4)
+    a.add_content(Datum(Interval(0, 10), Support('coarse')), net)
+    net.run()
+    a.add_content(Datum(Interval(2, 3), Support('fine')), net)
+    net.run()
+    assert [r.version for r in b.history] == [1, 2]
+    (adder_prop,) = net.propagators_ever_alerted
+    assert all(r.writer is adder_prop for r in b.history)
+    assert [r.writer for r in a.history] == [None, None]
+    assert [r.support.sup for r in a.history] == [{'coarse'}, {'fine'}]
+    # Unchanged content is not a revision.
+    a.add_content(Datum(Interval(2, 3), Support('fine')), net)
+    assert len(a.history) == 2
+
+
+def test_ring_buffer_evicts_the_oldest():
+    net, a, b = increment()
+    net.track_history(3, 'a')
+    a.add_content(Interval(0, 100), net)
+    for hi in (50, 40, 30, 20):
+        a.add_content(Interval(0, hi), net)
+    assert [r.version for r in a.history] == [3, 4, 5]
+    assert [r.content.hi for r in a.history] == [40, 30, 20]
+    assert a.history.version == 5
+    assert [r.support for r in a.history] == [None] * 3
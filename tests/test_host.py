@@ -0,0 +1,43 @@
+from propnet import Cell, Contradiction, Network, NetworkHost, adder
+
+
+def increment() -> Network:
+    net = Network()
+    adder(net.add_cell('a', Cell()), Cell(1), net.add_cell('b', Cell()), net=net)
+    return net
+
+
+def test_failing_job_is_reported_and_released():
+    host = NetworkHost()
+    results = host.solve_many(increment, [({'a': 1}, ['b']), ({'a': 1, 'b': 5}, ['b']),
+                                          ({'a': 2}, ['b'])])
+    assert results[0] == {'b': 2} and results[2] == {'b': 3}
+    assert isinstance(results[1], Contradiction)
+    assert not host._checked_out and not host._scheduled
+    assert host.solve_many(increment, [({'a': 3}, ['b'])]) == [{'b': 4}]
+
+
+def test_reset_clears_records():
+    host = NetworkHost()
+    net = host.acquire(increment)
+    net.track_provenance()
+    net['b'].track_history(4)
+    net['a'].add_content(1, net)
+    net.run()
+    host.release(net)
+    assert host.acquire(increment) is net
+    assert net.provenance.versions == {} and len(net['b'].history) == 0
+
+
+def increment_twice() -> Network:
+    net = Network()
+    mid = Cell()
+    adder(net.add_cell('a', Cell()), Cell(1), mid, net=net)
+    adder(mid, Cell(1), net.add_cell('b', Cell()), net=net)
+    return net
+
+
+def test_reset_clears_unnamed_cells():
+    host = NetworkHost()
+    assert host.solve_many(increment_twice, [({'a': 1}, ['b'])]) == [{'b': 3}]
+    assert host.solve_many(increment_twice, [({'a': 5}, ['b'])]) == [{'b': 7}]
@@ -0,0 +1,20 @@
+import math
+
+from propnet import Interval
+
+
+def test_zero_times_infinity():
+    x = Interval(0, math.inf) * Interval(0, 0)
+    assert x.lo <= 0 <= x.hi and x.hi < 1e-300
+
+
+def test_power_overflow_rounds_to_infinity():
+    assert (Interval(1e200, 1e200) ** 2).hi == math.inf
+    assert (Interval(1e200, 1e200) ** 3).hi == math.inf
+    assert (Interval(-1e200, -1e200) ** 3).lo == -math.inf
+
+
+def test_square_encloses():
+    x = Interval(2.9, 3.1) ** 2
+    assert x.lo < 2.9 * 2.9 and x.hi > 3.1 * 3.1
+    assert Interval(-1, 2) ** 2 == Interval(0.0, math.nextafter(4.0, math.inf))
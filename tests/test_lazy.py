@@ -0,0 +1,39 @@
+import pytest
+
+from propnet import Cell, LazyNetwork, adder, make_propagator
+
+
+def chain(net: LazyNetwork, prefix: str, n: int) -> None:
+    prev = net.add_cell(f'{prefix}0', Cell())
+    for i in range(1, n):
+        cell = net.add_cell(f'{prefix}{i}', Cell())
+        adder(prev, Cell(1), cell, net=net)
+        prev = cell
+
+
+def test_query_fires_only_the_cone():
+    net = LazyNetwork()
+    chain(net, 'x', 10)
+    chain(net, 'y', 10)
+    net['x0'].add_content(0, net)
+    net['y0'].add_content(0, net)
+    assert net.query('x9') == 9
+    assert net['y9'].content() is None
+    assert len(net.alerted_propagators) == 9
+    assert net.query('y9') == 9
+    assert net.alerted_propagators == []
+
+
+def test_failed_query_keeps_the_rest_alerted():
+    net = LazyNetwork()
+    a, b = net.add_cell('a', Cell()), net.add_cell('b', Cell())
+
+    def fail(x):
+        raise RuntimeError('boom')
+
+    make_propagator(fail, 'fail')(a, b, net=net)
+    adder(a, Cell(1), b, net=net)
+    a.add_content(1, net)
+    with pytest.raises(RuntimeError):
+        net.query('b')
+    assert [prop.label for prop in net.alerted_propagators] == ['adder']
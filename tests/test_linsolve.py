@@ -0,0 +1,48 @@
+import pytest
+
+from propnet import Cell, Contradiction, Network, linear, multiplier, product_, solve_linear, sum_
+
+
+def test_temperature():
+    net = Network()
+    f, c = net.add_cell('f', Cell()), net.add_cell('c', Cell())
+    f32, c9 = Cell(), Cell()
+    sum_(f32, Cell(32), f, net=net)
+    product_(f32, Cell(5), c9, net=net)
+    product_(c, Cell(9), c9, net=net)
+    c.add_content(25, net)
+    assert solve_linear(net) == 3
+    assert f.value == pytest.approx(77)
+    net.run()
+    assert f.value == pytest.approx(77)
+
+
+def test_simultaneous_equations():
+    # x + y = 3, x - y = 1, which local propagation cannot solve.
+    net = Network()
+    x, y = net.add_cell('x', Cell()), net.add_cell('y', Cell())
+    linear([1, 1], [x, y], 3, net)
+    linear([1, -1], [x, y], 1, net)
+    net.run()
+    assert x.value is None
+    assert solve_linear(net) == 2
+    assert (x.value, y.value) == (pytest.approx(2), pytest.approx(1))
+
+
+def test_badly_scaled():
+    net = Network()
+    a, b, c = (net.add_cell(name, Cell()) for name in 'abc')
+    multiplier(Cell(1e-13), a, b, net=net)
+    linear([1, 1], [b, c], 5, net)
+    c.add_content(4, net)
+    solve_linear(net)
+    assert a.value == pytest.approx(1e13)
+
+
+def test_inconsistent():
+    net = Network()
+    x, y = net.add_cell('x', Cell()), net.add_cell('y', Cell())
+    linear([1, 1], [x, y], 3, net)
+    linear([2, 2], [x, y], 7, net)
+    with pytest.raises(Contradiction):
+        solve_linear(net)
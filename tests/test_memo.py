@@ -0,0 +1,67 @@
+from propnet import TMS, Cell, Network, adder, bring_in, kick_out, linear
+
+
+def increment(net: Network) -> tuple[Cell, Cell]:
+    a, b = net.add_cell('a', Cell()), net.add_cell('b', Cell())
+    adder(a, Cell(1), b, net=net)
+    return a, b
+
+
+def test_unchanged_inputs_are_skipped():
+    net = Network()
+    a, b = increment(net)
+    a.add_content(1, net)
+    net.run()
+    assert net.stats.firings == 1 and net.stats.skipped == 0
+    net.alert_propagator(*net.propagators_ever_alerted)
+    net.run()
+    assert net.stats.firings == 2 and net.stats.skipped == 1
+    assert net.stats.skip_rate == 0.5
+    assert b.value == 2
+
+
+def test_constraints_skip_too():
+    net = Network()
+    x, y = net.add_cell('x', Cell()), net.add_cell('y', Cell())
+    linear([1, 1], [x, y], 3, net)
+    x.add_content(1, net)
+    net.run()
+    skipped = net.stats.skipped
+    net.alert_propagator(*net.propagators_ever_alerted)
+    net.run()
+    assert net.stats.skipped == skipped + 1
+    assert y.value == 2
+
+
+def test_skip_rate_without_firings():
+    assert Network().stats.skip_rate == 0.0
+
+
+def test_forget_inputs_recomputes():
+    net = Network()
+    a, b = increment(net)
+    a.add_content(1, net)
+    net.run()
+    # Changing a cell behind the network's back is not seen by the memo.
+    b.value = None
+    net.alert_propagator(*net.propagators_ever_alerted)
+    net.run()
+    assert b.value is None
+    net.forget_inputs()
+    net.alert_propagator(*net.propagators_ever_alerted)
+    net.run()
+    assert b.value == 2
+
+
+def test_worldview_change_recomputes():
+    # TMS contents stay the same objects when the worldview changes.
+    net = Network()
+    a, b = increment(net)
+    kick_out('p', net)
+    a.add_content(TMS.premise(1, 'p'), net)
+    net.run()
+    assert b.value is None
+    bring_in('p', net)
+    net.run()
+    with net.worldview():
+        assert b.value.strongest_consequence().value == 2
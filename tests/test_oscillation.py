@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+from propnet import Cell, Interval, Network, RunStatus, make_propagator
+
+
+@dataclass(frozen=True)
+class Flag:
+    # Not a lattice: the last write wins.
+    on: bool
+
+    def merge(self, other):
+        return other
+
+    def implies(self, other):
+        return self == other
+
+
+copy = make_propagator(lambda a: a, 'copy')
+toggle = make_propagator(lambda a: Flag(not a.on), 'toggle')
+creep = make_propagator(lambda a: Interval(a.lo + 1e-12, a.hi), 'creep')
+
+
+def flip_flop(**detection) -> Network:
+    net = Network()
+    x = net.add_cell('x', Cell(Flag(True)))
+    y = net.add_cell('y', Cell())
+    copy(x, y, net=net)
+    toggle(y, x, net=net)
+    net.detect_oscillation(**detection)
+    return net
+
+
+def test_repeated_content_stops_the_run():
+    net = flip_flop()
+    assert net.run() is RunStatus.OSCILLATING
+    report = net.oscillation.reports[-1]
+    assert set(report.cells) == {'x', 'y'}
+    assert {p.label for p in report.propagators} == {'copy', 'toggle'}
+
+
+def test_damped_run_is_not_quiescent():
+    assert flip_flop(damp=True).run() is RunStatus.DAMPED
+
+
+def test_change_count_spans_resumed_runs():
+    net = Network()
+    x = net.add_cell('x', Cell(Interval(0, 1)))
+    copy(x, net.add_cell('z', Cell()), net=net)
+    creep(net['z'], x, net=net)
+    net.detect_oscillation(max_changes=100)
+    for _ in range(100):
+        status = net.run(max_firings=10)
+        if status is not RunStatus.BUDGET_EXHAUSTED:
+            break
+    assert status is RunStatus.OSCILLATING
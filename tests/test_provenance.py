@@ -0,0 +1,14 @@
+from propnet import Cell, Interval, Network, fused_sum
+
+
+def test_constraint_inputs_are_versions_before_the_firing():
+    net = Network()
+    x = net.add_cell('x', Cell(Interval(0, 10)))
+    y = net.add_cell('y', Cell(Interval(0, 10)))
+    z = net.add_cell('z', Cell(Interval(0, 5)))
+    net.track_provenance()
+    fused_sum(x, y, z, net)
+    net.run()
+    y1 = net.explain('y')
+    assert y1.version == 1
+    assert {(node.name, node.version) for node in y1.inputs} == {('x', 0), ('z', 0)}
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from propnet import Cell, Network, RunStatus, adder
+
+
+def chain(n: int = 10) -> Network:
+    net = Network()
+    prev = net.add_cell('x0', Cell())
+    for i in range(1, n):
+        cell = net.add_cell(f'x{i}', Cell())
+        adder(prev, Cell(1), cell, net=net)
+        prev = cell
+    net['x0'].add_content(0, net)
+    return net
+
+
+class CancelAfter:
+    """Set once it has been checked ``n`` times."""
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def is_set(self) -> bool:
+        self.n -= 1
+        return self.n < 0
+
+
+def test_quiescent():
+    net = chain()
+    assert net.run() is RunStatus.QUIESCENT
+    assert net.run().quiescent
+    assert net['x9'].value == 9
+
+
+@pytest.mark.parametrize('limit, status', [
+    ({'max_firings': 3}, RunStatus.BUDGET_EXHAUSTED),
+    ({'deadline': time.monotonic() - 1}, RunStatus.DEADLINE_EXCEEDED),
+    ({'cancel_token': CancelAfter(3)}, RunStatus.CANCELLED),
+])
+def test_limits_stop_and_resume(limit, status):
+    net = chain()
+    assert net.run(**limit) is status
+    assert status.resumable
+    assert net['x9'].value is None and net.alerted_propagators
+    assert net.run() is RunStatus.QUIESCENT
+    assert net['x9'].value == 9
+    # Stopping early costs no extra firings.
+    assert net.stats.firings == 9
+
+
+def test_budget_counts_firings():
+    net = chain()
+    assert net.run(max_firings=3) is RunStatus.BUDGET_EXHAUSTED
+    assert net.stats.firings == 3
+    statuses = []
+    while (status := net.run(max_firings=2)) is not RunStatus.QUIESCENT:
+        statuses.append(status)
+    assert set(statuses) == {RunStatus.BUDGET_EXHAUSTED}
+    assert net['x9'].value == 9
+
+
+def test_cancel_with_an_event():
+    net = chain()
+    event = threading.Event()
+    event.set()
+    assert net.run(cancel_token=event) is RunStatus.CANCELLED
+    assert net.stats.firings == 0
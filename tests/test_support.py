@@ -0,0 +1,40 @@
+import pickle
+
+from propnet import Support
+
+
+def test_merge_is_lazy_and_flattens_once():
+    a, b = Support('a'), Support({'b', 'c'})
+    merged = a.merge(b)
+    assert merged._sup is None
+    assert merged.sup == {'a', 'b', 'c'}
+    assert merged._parts is None
+    assert a.merge(b) is merged
+
+
+def test_merge_with_itself_or_nothing():
+    a = Support('a')
+    assert a.merge(a) is a
+    assert a.merge(Support()) is a
+    assert Support().merge(a) is a
+
+
+def test_deep_chains():
+    support = Support('p0')
+    for i in range(1, 100_000):
+        support = support.merge(Support(f'p{i % 10}'))
+    assert support.sup == {f'p{i}' for i in range(10)}
+
+
+def test_equal_supports_share_their_set():
+    a = Support('a').merge(Support('b'))
+    b = Support({'b', 'a'})
+    assert a == b and hash(a) == hash(b)
+    assert a.sup is b.sup
+    assert not a.more_informative_than(b)
+    assert Support('a').more_informative_than(a)
+
+
+def test_pickle():
+    support = Support('a').merge(Support('b'))
+    assert pickle.loads(pickle.dumps(support)).sup == {'a', 'b'}
@@ -0,0 +1,34 @@
+import pytest
+
+from propnet import Cell, Network, NetworkTemplate, adder
+
+
+def capture() -> NetworkTemplate:
+    net = Network()
+    a, b = net.add_cell('a', Cell()), net.add_cell('b', Cell())
+    adder(a, Cell(1), b, net=net)
+    return NetworkTemplate.capture(net)
+
+
+def test_instances_are_independent():
+    template = capture()
+    x, y = template.instantiate(), template.instantiate()
+    x['a'].add_content(1, x)
+    x.run()
+    y.run()
+    assert x['b'].value == 2
+    assert y['b'].value is None
+
+
+def test_topology_is_fixed():
+    template = capture()
+    net = template.instantiate()
+    with pytest.raises(TypeError, match='TemplateNetwork'):
+        adder(net['a'], Cell(2), Cell(), net=net)
+    with pytest.raises(TypeError, match='TemplateNetwork'):
+        net.add_cell('c', Cell())
+    # The failed attempt did not touch the cells shared with other instances.
+    other = template.instantiate()
+    other['a'].add_content(1, other)
+    other.run()
+    assert other['b'].value == 2
@@ -0,0 +1,26 @@
+import pytest
+
+from propnet import TMS, Cell, Interval, Network, kick_out, product_
+
+
+def scaled():
+    net = Network()
+    product_(net.add_cell('x', Cell()), net.add_cell('k', Cell(TMS.premise(2.0))),
+             net.add_cell('y', Cell()), net=net)
+    net['x'].add_content(TMS.premise(Interval(1, 3), 'coarse'), net)
+    net['x'].add_content(TMS.premise(Interval(2, 4), 'fine'), net)
+    net.run()
+    return net
+
+
+def test_worldviews_are_per_network():
+    a, b = scaled(), scaled()
+    kick_out('fine', a)
+    a.run()
+    b.run()
+    with a.worldview():
+        y = a['y'].content().strongest_consequence().value
+    assert (y.lo, y.hi) == pytest.approx((2, 6))
+    with b.worldview():
+        y = b['y'].content().strongest_consequence().value
+    assert (y.lo, y.hi) == pytest.approx((4, 6))
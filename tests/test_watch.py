@@ -0,0 +1,89 @@
+import pytest
+
+from propnet import Cell, Change, Interval, LazyNetwork, Network, adder, multiplier
+
+
+def narrowing(cls=Network) -> Network:
+    # b = a + 1 and c = 2 * b
+    net = cls()
+    a, b, c = (net.add_cell(name, Cell()) for name in 'abc')
+    adder(a, Cell(1), b, net=net)
+    multiplier(Cell(2), b, c, net=net)
+    return net
+
+
+def test_immediate_delivery():
+    net = narrowing()
+    changes = []
+    net.watch('c', changes.append)
+    net['a'].add_content(Interval(0, 10), net)
+    net.run()
+    net['a'].add_content(Interval(0, 5), net)
+    net.fire_next()
+    assert len(changes) == 1
+    net.fire_next()
+    assert [(c.name, c.previous) for c in changes] == [('c', None), ('c', changes[0].content)]
+    assert changes[-1].content is net['c'].value
+
+
+def test_coalesced_delivery_at_the_end_of_a_run():
+    net = narrowing()
+    changes = []
+    net.watch('b', changes.append, coalesce=True)
+    net['a'].add_content(Interval(0, 10), net)
+    net['a'].add_content(Interval(0, 5), net)
+    assert changes == []
+    net.run()
+    assert changes == [Change('b', None, net['b'].value)]
+
+
+def test_changes_between_runs():
+    net = narrowing()
+    immediate, coalesced = [], []
+    net.watch('a', immediate.append)
+    net.watch('a', coalesced.append, coalesce=True)
+    net['a'].add_content(Interval(0, 10), net)
+    assert len(immediate) == 1 and coalesced == []
+    net.notify()
+    assert coalesced == [Change('a', None, Interval(0, 10))]
+    net['a'].add_content(Interval(0, 5), net)
+    net.run()
+    assert coalesced[-1] == Change('a', Interval(0, 10), Interval(0, 5))
+
+
+def test_cancel():
+    net = narrowing()
+    immediate, coalesced = [], []
+    watch = net.watch('c', immediate.append)
+    pending = net.watch('c', coalesced.append, coalesce=True)
+    net['a'].add_content(Interval(0, 10), net)
+    watch.cancel()
+    net.fire_next()
+    net.fire_next()
+    pending.cancel()
+    net.run()
+    assert immediate == [] and coalesced == []
+    watch.cancel()
+
+
+def test_lazy_network():
+    net = narrowing(LazyNetwork)
+    changes = []
+    net.watch('c', changes.append, coalesce=True)
+    net['a'].add_content(1, net)
+    assert changes == []
+    assert net.query('c') == 4
+    assert changes == [Change('c', None, 4)]
+
+
+def test_wavefront_network():
+    pytest.importorskip('numpy')
+    from propnet.wavefront import WavefrontNetwork
+
+    net = narrowing(WavefrontNetwork)
+    immediate, coalesced = [], []
+    net.watch('c', immediate.append)
+    net.watch('c', coalesced.append, coalesce=True)
+    net['a'].add_content(1.0, net)
+    net.run()
+    assert immediate == coalesced == [Change('c', None, 4.0)]
@@ -0,0 +1,75 @@
+import pytest
+
+from propnet import (Affine, Cell, Contradiction, Datum, Interval, Network, Support, adder, divider,
+                     multiplier)
+
+np = pytest.importorskip('numpy')
+from propnet.wavefront import WavefrontNetwork  # noqa: E402
+
+
+def wide(cls, propagator, pairs):
+    net = cls(min_group=2) if cls is WavefrontNetwork else cls()
+    outputs = []
+    for x, y in pairs:
+        outputs.append(Cell())
+        propagator(Cell(x), Cell(y), outputs[-1], net=net)
+    net.run()
+    return [cell.value for cell in outputs]
+
+
+@pytest.mark.parametrize('propagator, pairs', [
+    (multiplier, [(Affine.from_interval(1, 2), Interval(2, 3))] * 3),
+    (adder, [(2 ** 60 + 1, 1), (3, 4), (1.5, 2)]),
+    (divider, [(1.0, 0.0), (1.0, 2.0)]),
+])
+def test_same_results_as_network(propagator, pairs):
+    try:
+        expected = wide(Network, propagator, pairs)
+    except ZeroDivisionError:
+        with pytest.raises(ZeroDivisionError):
+            wide(WavefrontNetwork, propagator, pairs)
+        return
+    assert list(map(str, wide(WavefrontNetwork, propagator, pairs))) == list(map(str, expected))
+
+
+def chains(cls, contents, width=16, depth=4):
+    net = cls(min_group=2) if cls is WavefrontNetwork else cls()
+    one = Cell(contents(1.0))
+    ends = []
+    for i in range(width):
+        prev = net.add_cell(f'x{i}', Cell())
+        for _ in range(depth):
+            cell = Cell()
+            adder(prev, one, cell, net=net)
+            prev = cell
+        ends.append(prev)
+    for i in range(width):
+        net[f'x{i}'].add_content(contents(float(i)), net)
+    return net, ends
+
+
+@pytest.mark.parametrize('contents', [
+    lambda x: x,
+    lambda x: Interval(x, x + 0.5),
+    lambda x: Datum(Interval(x, x + 0.5), Support('in')),
+])
+def test_chains_like_network(contents):
+    expected, ends = chains(Network, contents)
+    expected.run()
+    net, wave_ends = chains(WavefrontNetwork, contents)
+    net.run()
+    assert list(map(str, (c.value for c in wave_ends))) == list(map(str, (c.value for c in ends)))
+    # Recomputed results that the outputs already hold do not change them.
+    for cell in wave_ends:
+        cell.track_history(4)
+    net.forget_inputs()
+    net.alert_propagator(*net.propagators_ever_alerted)
+    net.run()
+    assert all(len(cell.history) == 1 for cell in wave_ends)
+
+
+def test_contradiction_in_a_batch():
+    net, ends = chains(WavefrontNetwork, lambda x: Interval(x, x + 0.5))
+    ends[3].add_content(Interval(100, 101), net)
+    with pytest.raises(Contradiction):
+        net.run()